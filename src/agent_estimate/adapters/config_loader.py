@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import tempfile
 from collections.abc import Mapping, Sequence
 from importlib.metadata import EntryPoint, entry_points
 from importlib.resources import as_file, files
@@ -11,6 +15,16 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from agent_estimate.core.models import (
     AgentProfile,
     AgentProfileProtocol,
@@ -19,34 +33,110 @@ from agent_estimate.core.models import (
 
 DEFAULT_CONFIG_FILENAME = "default_agents.yaml"
 ENTRY_POINT_GROUP = "agent_estimate.agents"
+CONFIG_CACHE_ENV = "AGENT_ESTIMATE_CACHE_CONFIG"
+CONFIG_CACHE_SUFFIX = ".cache.json"
 
 
 def load_config(path: str | Path) -> EstimationConfig:
-    """Load and validate an estimation configuration file."""
-    config_path = Path(path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    """Load and validate an estimation configuration file.
 
+    Parsed configs are cached per ``(path, mtime, size)``, so repeated loads of
+    an unchanged file skip YAML parsing and validation. Plugin profiles are
+    still merged on every call when any are installed.
+    """
+    config_path = Path(path)
     try:
-        raw_data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
-    except yaml.YAMLError as exc:
-        raise ValueError(f"Failed to parse YAML config at {config_path}: {exc}") from exc
-    except OSError as exc:
-        raise OSError(f"Failed to read config file {config_path}: {exc}") from exc
+        stat_result = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    # Callers own the returned config: deep-copy so that mutating its settings,
+    # agents list or profiles never reaches the cached instance.
+    config = _load_validated_config(
+        str(config_path.resolve()),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    ).model_copy(deep=True)
+    if not _iter_agent_entry_points():
+        # No plugins: nothing to merge; the deep copy above is already private.
+        return config
+    merged_agents = discover_agent_profiles(config.agents)
+    return config.model_copy(update={"agents": merged_agents})
+
 
+@functools.lru_cache(maxsize=32)
+def _load_validated_config(path_str: str, mtime_ns: int, size: int) -> EstimationConfig:
+    """Parse and validate one config file; cache key includes mtime and size."""
+    del mtime_ns, size  # cache-key only
+    config_path = Path(path_str)
+    raw_data = _load_raw_config(config_path)
     if raw_data is None:
         raw_data = {}
     if not isinstance(raw_data, dict):
         raise ValueError(f"Invalid config file at {config_path}: root must be a YAML mapping")
 
     try:
-        config = EstimationConfig.model_validate(raw_data)
+        return EstimationConfig.model_validate(raw_data)
     except ValidationError as exc:
         detail_text = _format_validation_errors(exc)
         raise ValueError(f"Invalid config file at {config_path}:\n{detail_text}") from exc
 
-    merged_agents = discover_agent_profiles(config.agents)
-    return config.model_copy(update={"agents": merged_agents})
+
+def _load_raw_config(config_path: Path) -> object:
+    """Parse the YAML file, going through the JSON sidecar cache when enabled.
+
+    Setting ``AGENT_ESTIMATE_CACHE_CONFIG=1`` writes ``<config>.cache.json``
+    after a successful parse and reads it back while it is not older than the
+    YAML source.
+    """
+    cache_enabled = os.environ.get(CONFIG_CACHE_ENV) == "1"
+    cache_path = config_path.with_name(config_path.name + CONFIG_CACHE_SUFFIX)
+    if cache_enabled:
+        cached = _read_config_cache(config_path, cache_path)
+        if cached is not None:
+            return cached
+
+    try:
+        raw_data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Failed to parse YAML config at {config_path}: {exc}") from exc
+    except OSError as exc:
+        raise OSError(f"Failed to read config file {config_path}: {exc}") from exc
+
+    if cache_enabled and isinstance(raw_data, dict):
+        _write_config_cache(cache_path, raw_data)
+    return raw_data
+
+
+def _read_config_cache(config_path: Path, cache_path: Path) -> dict[str, Any] | None:
+    try:
+        if cache_path.stat().st_mtime_ns < config_path.stat().st_mtime_ns:
+            return None
+        payload = cache_path.read_bytes()
+        cached = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _write_config_cache(cache_path: Path, raw_data: dict[str, Any]) -> None:
+    """Best-effort atomic write; a read-only config directory is not an error."""
+    try:
+        payload = (
+            orjson.dumps(raw_data) if orjson is not None else json.dumps(raw_data).encode("utf-8")
+        )
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError):
+        return
 
 
 def load_default_config() -> EstimationConfig:
@@ -77,16 +167,32 @@ def discover_plugin_profiles() -> list[AgentProfile]:
     return list(discovered.values())
 
 
-def _iter_agent_entry_points() -> list[EntryPoint]:
+def refresh_agent_entry_points() -> None:
+    """Forget cached entry points and plugin profiles.
+
+    Call this after installing or removing plugins in a running process.
+    """
+    _iter_agent_entry_points.cache_clear()
+    _cached_entry_point_profile.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _iter_agent_entry_points() -> tuple[EntryPoint, ...]:
     all_entry_points = entry_points()
     if hasattr(all_entry_points, "select"):
-        return list(all_entry_points.select(group=ENTRY_POINT_GROUP))
+        return tuple(all_entry_points.select(group=ENTRY_POINT_GROUP))
     if isinstance(all_entry_points, Mapping):
-        return list(all_entry_points.get(ENTRY_POINT_GROUP, ()))
-    return [ep for ep in all_entry_points if getattr(ep, "group", None) == ENTRY_POINT_GROUP]
+        return tuple(all_entry_points.get(ENTRY_POINT_GROUP, ()))
+    return tuple(ep for ep in all_entry_points if getattr(ep, "group", None) == ENTRY_POINT_GROUP)
 
 
 def _load_entry_point_profile(ep: EntryPoint) -> AgentProfile:
+    """Return a fresh copy of the entry point's profile; loading it is cached."""
+    return _cached_entry_point_profile(ep).model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_entry_point_profile(ep: EntryPoint) -> AgentProfile:
     try:
         loaded = ep.load()
     except Exception as exc:  # pragma: no cover - defensive path
@@ -10,7 +10,7 @@ class GitHubAdapterError(RuntimeError):
     """Raised when issue retrieval from GitHub fails."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GitHubIssue:
     """Normalized issue payload used by estimators."""
 
@@ -23,10 +23,12 @@ class GitHubIssue:
 def build_task_description(title: str, body: str | None) -> str:
     """Build one task description from issue title and body text."""
     trimmed_title = title.strip()
-    trimmed_body = (body or "").strip()
+    if not body:
+        return trimmed_title
+    trimmed_body = body.strip()
     if not trimmed_body:
         return trimmed_title
-    return f"{trimmed_title}\n\n{trimmed_body}"
+    return trimmed_title + "\n\n" + trimmed_body
 
 
 class GitHubIssueAdapter(Protocol):
@@ -12,6 +12,8 @@ from agent_estimate.adapters.github_adapter import (
     build_task_description,
 )
 
+GRAPHQL_BATCH_SIZE = 100
+
 
 class GitHubGhCliAdapter:
     """Fetch GitHub issues through gh CLI commands."""
@@ -20,23 +22,20 @@ class GitHubGhCliAdapter:
         self._runner = runner or _run_gh
 
     def fetch_issues_by_numbers(self, repo: str, issue_numbers: Sequence[int]) -> list[GitHubIssue]:
-        """Fetch specific issues by number."""
+        """Fetch specific issues by number.
+
+        Issues are looked up through one ``gh api graphql`` call per batch of
+        up to 100 numbers. A batch falls back to per-issue ``gh issue view``
+        calls if the GraphQL request fails.
+        """
+        numbers = [int(number) for number in issue_numbers]
         issues: list[GitHubIssue] = []
-        for issue_number in issue_numbers:
-            output = self._runner(
-                [
-                    "gh",
-                    "issue",
-                    "view",
-                    str(issue_number),
-                    "--repo",
-                    repo,
-                    "--json",
-                    "number,title,body",
-                ],
-            )
-            payload = json.loads(output)
-            issues.append(_parse_issue(payload))
+        for start in range(0, len(numbers), GRAPHQL_BATCH_SIZE):
+            batch = numbers[start : start + GRAPHQL_BATCH_SIZE]
+            try:
+                issues.extend(self._fetch_issue_batch(repo, batch))
+            except GitHubAdapterError:
+                issues.extend(self._fetch_issues_individually(repo, batch))
         return issues
 
     def fetch_issues_by_label(
@@ -87,6 +86,67 @@ class GitHubGhCliAdapter:
         """Fetch labeled issues and return task descriptions."""
         return [issue.task_description for issue in self.fetch_issues_by_label(repo, label, state=state)]
 
+    def _fetch_issue_batch(self, repo: str, issue_numbers: list[int]) -> list[GitHubIssue]:
+        owner, _, name = repo.partition("/")
+        if not owner or not name:
+            raise GitHubAdapterError(f"Invalid repository {repo!r}; expected owner/name")
+        output = self._runner(
+            [
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={_build_issue_batch_query(issue_numbers)}",
+                "-f",
+                f"owner={owner}",
+                "-f",
+                f"name={name}",
+            ],
+        )
+        try:
+            payload = json.loads(output)
+            repository = payload["data"]["repository"]
+            raw_issues = [repository[f"i{index}"] for index in range(len(issue_numbers))]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise GitHubAdapterError(f"Unexpected gh api graphql output: {output[:200]!r}") from exc
+        if not all(isinstance(raw_issue, dict) for raw_issue in raw_issues):
+            raise GitHubAdapterError(f"Missing issues in gh api graphql output: {output[:200]!r}")
+        return [_parse_issue(raw_issue) for raw_issue in raw_issues]
+
+    def _fetch_issues_individually(
+        self,
+        repo: str,
+        issue_numbers: list[int],
+    ) -> list[GitHubIssue]:
+        issues: list[GitHubIssue] = []
+        for issue_number in issue_numbers:
+            output = self._runner(
+                [
+                    "gh",
+                    "issue",
+                    "view",
+                    str(issue_number),
+                    "--repo",
+                    repo,
+                    "--json",
+                    "number,title,body",
+                ],
+            )
+            payload = json.loads(output)
+            issues.append(_parse_issue(payload))
+        return issues
+
+
+def _build_issue_batch_query(issue_numbers: Sequence[int]) -> str:
+    fields = " ".join(
+        f"i{index}: issue(number: {int(number)}) {{ number title body }}"
+        for index, number in enumerate(issue_numbers)
+    )
+    return (
+        "query($owner: String!, $name: String!) { "
+        f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    )
+
 
 def _run_gh(args: list[str]) -> str:
     result = subprocess.run(args, check=False, capture_output=True, text=True)
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import gzip
+import http.client
 import os
 import subprocess
+import threading
 import time
-from typing import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Sequence
 from urllib.error import HTTPError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - optional speedup
+    import json as _json  # type: ignore[no-redef]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None  # type: ignore[assignment]
 
 from agent_estimate.adapters.github_adapter import (
     GitHubAdapterError,
@@ -19,6 +35,16 @@ from agent_estimate.adapters.github_adapter import (
 
 BASE_URL = "https://api.github.com"
 
+# request_fn(url, headers) -> (status, headers, body). The default returns the
+# raw body bytes and the response's case-insensitive HTTPMessage; str bodies and
+# plain header dicts from injected callables are still accepted.
+ResponseHeaders = Mapping[str, str] | Message
+RequestFn = Callable[[str, Mapping[str, str]], tuple[int, ResponseHeaders, "bytes | str"]]
+DEFAULT_MAX_WORKERS = 8
+# Followed on the pooled path (renamed repos and transferred issues answer 301).
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
 
 class GitHubRestAdapter:
     """Fetch GitHub issues through the REST API."""
@@ -30,32 +56,61 @@ class GitHubRestAdapter:
         max_retries: int = 3,
         initial_backoff_seconds: float = 1.0,
         timeout_seconds: float = 15.0,
-        request_fn: Callable[[str, Mapping[str, str]], tuple[int, dict[str, str], str]] | None = None,
+        request_fn: RequestFn | None = None,
         sleep_fn: Callable[[float], None] = time.sleep,
         now_fn: Callable[[], float] = time.time,
         token_provider: Callable[[], str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        etag_cache: bool = False,
     ) -> None:
         self._token = token or (token_provider or _resolve_github_token)()
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {
+                "Accept": "application/vnd.github+json",
+                "Accept-Encoding": "gzip",
+                "Authorization": f"Bearer {self._token}",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "agent-estimate",
+            },
+        )
         self._max_retries = max_retries
         self._initial_backoff_seconds = initial_backoff_seconds
         self._timeout_seconds = timeout_seconds
         self._request_fn = request_fn or self._default_request
         self._sleep_fn = sleep_fn
         self._now_fn = now_fn
+        self._max_workers = max(1, max_workers)
+        # Idle keep-alive connections per host, shared by worker threads.
+        self._idle_connections: dict[str, list[http.client.HTTPSConnection]] = {}
+        self._connections_lock = threading.Lock()
+        # Opt-in: label-list pages keyed by URL: (etag, decoded issues, next page URL).
+        # A 304 reply to If-None-Match reuses the page and costs no rate-limit quota,
+        # but every page stays in memory for the adapter's lifetime.
+        self._etag_cache: dict[str, tuple[str, tuple[GitHubIssue, ...], str | None]] | None = (
+            {} if etag_cache else None
+        )
+
+    def close(self) -> None:
+        """Close pooled keep-alive connections."""
+        with self._connections_lock:
+            pooled = [conn for conns in self._idle_connections.values() for conn in conns]
+            self._idle_connections.clear()
+        for conn in pooled:
+            conn.close()
 
     def fetch_issues_by_numbers(self, repo: str, issue_numbers: Sequence[int]) -> list[GitHubIssue]:
-        """Fetch specific issues by number."""
-        issues: list[GitHubIssue] = []
-        for issue_number in issue_numbers:
-            payload, _ = self._request_json(
-                f"{BASE_URL}/repos/{repo}/issues/{issue_number}",
-            )
-            if not isinstance(payload, dict):
-                raise GitHubAdapterError(f"Unexpected payload for issue #{issue_number}: {payload!r}")
-            if "pull_request" in payload:
-                continue
-            issues.append(_parse_issue(payload))
-        return issues
+        """Fetch specific issues by number.
+
+        Requests run concurrently (up to ``max_workers``); results keep the
+        input order and pull requests are skipped.
+        """
+        numbers = list(issue_numbers)
+        if len(numbers) <= 1 or self._max_workers == 1:
+            results = [self._fetch_issue(repo, number) for number in numbers]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(numbers))) as pool:
+                results = list(pool.map(lambda number: self._fetch_issue(repo, number), numbers))
+        return [issue for issue in results if issue is not None]
 
     def fetch_issues_by_label(
         self,
@@ -64,25 +119,8 @@ class GitHubRestAdapter:
         *,
         state: str = "open",
     ) -> list[GitHubIssue]:
-        """Fetch issues by label, handling paginated API responses."""
-        issues: list[GitHubIssue] = []
-        page = 1
-        while True:
-            query = urlencode({"state": state, "labels": label, "per_page": 100, "page": page})
-            payload, _ = self._request_json(f"{BASE_URL}/repos/{repo}/issues?{query}")
-            if not isinstance(payload, list):
-                raise GitHubAdapterError(
-                    f"Unexpected payload when listing issues by label '{label}': {payload!r}",
-                )
-            if not payload:
-                break
-            for raw_issue in payload:
-                if isinstance(raw_issue, dict) and "pull_request" not in raw_issue:
-                    issues.append(_parse_issue(raw_issue))
-            if len(payload) < 100:
-                break
-            page += 1
-        return issues
+        """Fetch issues by label, following the ``Link: rel="next"`` pagination header."""
+        return list(self._iter_issues_by_label(repo, label, state=state))
 
     def fetch_task_descriptions_by_numbers(
         self,
@@ -100,22 +138,65 @@ class GitHubRestAdapter:
         state: str = "open",
     ) -> list[str]:
         """Fetch labeled issues and return task descriptions."""
-        return [issue.task_description for issue in self.fetch_issues_by_label(repo, label, state=state)]
+        return [
+            issue.task_description
+            for issue in self._iter_issues_by_label(repo, label, state=state)
+        ]
 
-    def _request_json(self, url: str) -> tuple[object, dict[str, str]]:
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "Authorization": f"Bearer {self._token}",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "agent-estimate",
-        }
+    def _iter_issues_by_label(self, repo: str, label: str, *, state: str) -> Iterator[GitHubIssue]:
+        """Yield labeled issues page by page so only one page is held at a time."""
+        query = urlencode({"state": state, "labels": label, "per_page": 100, "page": 1})
+        url: str | None = f"{BASE_URL}/repos/{repo}/issues?{query}"
+        etag_cache = self._etag_cache
+        while url is not None:
+            cached = etag_cache.get(url) if etag_cache is not None else None
+            request_headers = (
+                self._headers if cached is None else {**self._headers, "If-None-Match": cached[0]}
+            )
+            status, body, headers = self._request(url, request_headers)
+            if status == 304 and cached is not None:
+                yield from cached[1]
+                url = cached[2]
+                continue
+            try:
+                page, page_size = _decode_issue_page(body)
+            except (TypeError, ValueError) as exc:
+                raise GitHubAdapterError(
+                    f"Unexpected payload when listing issues by label '{label}': {_preview(body)}",
+                ) from exc
+            next_url = _next_page_url(headers.get("link")) if page_size else None
+            etag = headers.get("etag")
+            if etag_cache is not None and etag:
+                etag_cache[url] = (etag, tuple(page), next_url)
+            yield from page
+            url = next_url
 
+    def _fetch_issue(self, repo: str, issue_number: int) -> GitHubIssue | None:
+        _, body, _ = self._request(f"{BASE_URL}/repos/{repo}/issues/{issue_number}")
+        try:
+            return _decode_issue(body)
+        except (TypeError, ValueError) as exc:
+            raise GitHubAdapterError(
+                f"Unexpected payload for issue #{issue_number}: {_preview(body)}",
+            ) from exc
+
+    def _request(
+        self,
+        url: str,
+        request_headers: Mapping[str, str] | None = None,
+    ) -> tuple[int, bytes | str, ResponseHeaders]:
+        """GET ``url`` with rate-limit retries; return status, raw body and headers.
+
+        The returned headers answer lowercase ``get`` lookups.
+        """
+        if request_headers is None:
+            request_headers = self._headers
         for attempt in range(self._max_retries + 1):
-            status, response_headers, body = self._request_fn(url, headers)
-            normalized_headers = {key.lower(): value for key, value in response_headers.items()}
+            status, response_headers, body = self._request_fn(url, request_headers)
+            normalized_headers = _case_insensitive_headers(response_headers)
 
             if status < 400:
-                return json.loads(body), normalized_headers
+                return status, body, normalized_headers
 
             if _is_rate_limited(status, normalized_headers) and attempt < self._max_retries:
                 self._sleep_fn(
@@ -129,26 +210,119 @@ class GitHubRestAdapter:
                 continue
 
             raise GitHubAdapterError(
-                f"GitHub API request failed with status {status} for {url}: {body[:200]}",
+                f"GitHub API request failed with status {status} for {url}: {_preview(body)}",
             )
 
         raise GitHubAdapterError(f"GitHub API request failed after retries for {url}")
 
-    def _default_request(self, url: str, headers: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+    def _default_request(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> tuple[int, Message, bytes]:
+        """GET over a pooled keep-alive connection, following redirects.
+
+        URLs that must go through an ``HTTPS_PROXY`` (and are not excluded by
+        ``NO_PROXY``), or that are not HTTPS, use urllib instead, which handles
+        proxies and redirects itself.
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme != "https" or _uses_proxy(parts.scheme, parts.hostname):
+                return self._urllib_request(url, headers)
+            path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+            try:
+                status, message, body = self._send_request(parts.netloc, path, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server dropped an idle keep-alive connection; retry once on a new one.
+                status, message, body = self._send_request(
+                    parts.netloc, path, headers, reuse=False
+                )
+            location = message.get("Location")
+            if status not in _REDIRECT_STATUSES or not location:
+                return status, message, body
+            target = urljoin(url, location)
+            if urlsplit(target).netloc != parts.netloc:
+                # Never forward the token to a different host.
+                headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+            url = target
+        raise GitHubAdapterError(f"GitHub API request exceeded {_MAX_REDIRECTS} redirects: {url}")
+
+    def _urllib_request(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> tuple[int, Message, bytes]:
         request = Request(url=url, headers=dict(headers), method="GET")
         try:
             with urlopen(request, timeout=self._timeout_seconds) as response:
-                return response.status, dict(response.headers.items()), response.read().decode("utf-8")
+                status, message, body = response.status, response.headers, response.read()
         except HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            return exc.code, dict(exc.headers.items()) if exc.headers else {}, body
+            status, message, body = exc.code, exc.headers or Message(), exc.read()
+        if (message.get("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return status, message, body
+
+    def _send_request(
+        self,
+        host: str,
+        path: str,
+        headers: Mapping[str, str],
+        *,
+        reuse: bool = True,
+    ) -> tuple[int, Message, bytes]:
+        conn = self._acquire_connection(host) if reuse else self._new_connection(host)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_connection(host, conn)
+        # http.client does not decode transfer compression; error bodies are gzipped too.
+        if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return response.status, response.msg, body
+
+    def _acquire_connection(self, host: str) -> http.client.HTTPSConnection:
+        with self._connections_lock:
+            idle = self._idle_connections.get(host)
+            if idle:
+                return idle.pop()
+        return self._new_connection(host)
+
+    def _new_connection(self, host: str) -> http.client.HTTPSConnection:
+        return http.client.HTTPSConnection(host, timeout=self._timeout_seconds)
+
+    def _release_connection(self, host: str, conn: http.client.HTTPSConnection) -> None:
+        with self._connections_lock:
+            self._idle_connections.setdefault(host, []).append(conn)
+
+
+def _uses_proxy(scheme: str, host: str | None) -> bool:
+    """Return True when the environment routes *scheme* requests to *host* via a proxy."""
+    return scheme in getproxies() and not proxy_bypass(host or "")
 
 
 def _resolve_github_token() -> str:
     token = os.getenv("GITHUB_TOKEN")
     if token:
         return token
+    return _gh_auth_token()
+
+
+def _invalidate_token_cache() -> None:
+    """Forget the cached ``gh auth token`` result (e.g. after re-login)."""
+    _gh_auth_token.cache_clear()
 
+
+@functools.lru_cache(maxsize=1)
+def _gh_auth_token() -> str:
+    """Run ``gh auth token`` once per process; failures are not cached."""
     result = subprocess.run(
         ["gh", "auth", "token"],
         check=False,
@@ -164,6 +338,78 @@ def _resolve_github_token() -> str:
     return result.stdout.strip()
 
 
+if msgspec is not None:
+
+    class _RawIssue(msgspec.Struct):
+        """The subset of the GitHub issue payload the adapter reads."""
+
+        number: int
+        title: str | None = None
+        body: str | None = None
+        pull_request: dict[str, Any] | None = None
+
+    _ISSUE_DECODER = msgspec.json.Decoder(_RawIssue)
+    _ISSUE_PAGE_DECODER = msgspec.json.Decoder(list[_RawIssue])
+else:  # pragma: no cover - exercised only without msgspec installed
+    _ISSUE_DECODER = None
+    _ISSUE_PAGE_DECODER = None
+
+
+def _decode_issue(body: bytes | str) -> GitHubIssue | None:
+    """Decode one issue payload; return None for pull requests.
+
+    Raises ValueError for undecodable JSON and TypeError (or a msgspec
+    ValidationError, itself a ValueError) when it is not an issue object.
+    """
+    if _ISSUE_DECODER is not None:
+        raw = _ISSUE_DECODER.decode(body)
+        if raw.pull_request is not None:
+            return None
+        return _issue_from_fields(raw.number, raw.title, raw.body)
+    payload = _json.loads(body)
+    if not isinstance(payload, dict):
+        raise TypeError("expected an issue object")
+    if "pull_request" in payload:
+        return None
+    return _parse_issue(payload)
+
+
+def _decode_issue_page(body: bytes | str) -> tuple[list[GitHubIssue], int]:
+    """Decode one issue-list page; return (issues without pull requests, raw item count).
+
+    Raises ValueError for undecodable JSON and TypeError (or a msgspec
+    ValidationError, itself a ValueError) when it is not a list of issues.
+    """
+    if _ISSUE_PAGE_DECODER is not None:
+        raw_issues = _ISSUE_PAGE_DECODER.decode(body)
+        issues = [
+            _issue_from_fields(raw.number, raw.title, raw.body)
+            for raw in raw_issues
+            if raw.pull_request is None
+        ]
+        return issues, len(raw_issues)
+    payload = _json.loads(body)
+    if not isinstance(payload, list):
+        raise TypeError("expected a list of issues")
+    issues = [
+        _parse_issue(raw_issue)
+        for raw_issue in payload
+        if isinstance(raw_issue, dict) and "pull_request" not in raw_issue
+    ]
+    return issues, len(payload)
+
+
+def _issue_from_fields(number: int, title: str | None, body: str | None) -> GitHubIssue:
+    title = title or ""
+    body = body or ""
+    return GitHubIssue(
+        number=number,
+        title=title,
+        body=body,
+        task_description=build_task_description(title=title, body=body),
+    )
+
+
 def _parse_issue(raw_issue: Mapping[str, object]) -> GitHubIssue:
     number = int(raw_issue["number"])
     title = str(raw_issue.get("title", ""))
@@ -176,7 +422,36 @@ def _parse_issue(raw_issue: Mapping[str, object]) -> GitHubIssue:
     )
 
 
-def _is_rate_limited(status: int, headers: Mapping[str, str]) -> bool:
+def _next_page_url(link_header: str | None) -> str | None:
+    """Return the ``rel="next"`` target from a GitHub ``Link`` header, if any."""
+    if not link_header:
+        return None
+    for part in link_header.split(","):
+        target, _, params = part.partition(";")
+        if 'rel="next"' in params:
+            return target.strip().lstrip("<").rstrip(">")
+    return None
+
+
+def _preview(body: bytes | str, limit: int = 200) -> str:
+    """Decode only the leading slice of a response body for error messages."""
+    if isinstance(body, bytes):
+        return body[:limit].decode("utf-8", errors="replace")
+    return body[:limit]
+
+
+def _case_insensitive_headers(headers: ResponseHeaders) -> ResponseHeaders:
+    """Return headers that answer lowercase lookups.
+
+    ``http.client`` messages are already case-insensitive; only plain mappings
+    from injected request functions need lowercasing.
+    """
+    if isinstance(headers, Message):
+        return headers
+    return {key.lower(): value for key, value in headers.items()}
+
+
+def _is_rate_limited(status: int, headers: ResponseHeaders) -> bool:
     if status == 429:
         return True
     return status == 403 and headers.get("x-ratelimit-remaining") == "0"
@@ -184,7 +459,7 @@ def _is_rate_limited(status: int, headers: Mapping[str, str]) -> bool:
 
 def _compute_retry_delay(
     *,
-    headers: Mapping[str, str],
+    headers: ResponseHeaders,
     attempt: int,
     initial_backoff_seconds: float,
     now_seconds: float,
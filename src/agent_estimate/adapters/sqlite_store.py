@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import math
+import queue
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from threading import RLock
+from threading import Lock, Thread
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass(frozen=True)
 class ObservationInput:
@@ -33,6 +45,30 @@ class ObservationInput:
     modifiers_should_have_been: dict[str, float]
     observed_at: str | None = None
 
+    def __post_init__(self) -> None:
+        _validate_observation(self)
+
+    @classmethod
+    def trusted(cls, **values: Any) -> ObservationInput:
+        """Build an observation without validation, for already-validated data.
+
+        Field names are still checked, so a typo raises TypeError like ``__init__``.
+        """
+        names = {field.name for field in fields(cls)}
+        unknown = values.keys() - names
+        if unknown:
+            raise TypeError(f"unknown observation fields: {', '.join(sorted(unknown))}")
+        missing = names - values.keys() - {"observed_at"}
+        if missing:
+            raise TypeError(f"missing observation fields: {', '.join(sorted(missing))}")
+        instance = object.__new__(cls)
+        for name, value in {"observed_at": None, **values}.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+
+_EXPORT_BATCH_SIZE = 1000
+
 
 class SQLiteCalibrationStore:
     """SQLite-backed storage and aggregation for calibration metrics."""
@@ -42,15 +78,29 @@ class SQLiteCalibrationStore:
         path: str | Path,
         *,
         k_anonymity_floor: int = 5,
+        pragmas: Mapping[str, str | int] | None = None,
     ) -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._k_anonymity_floor = k_anonymity_floor
-        self._lock = RLock()
-        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        self._pragmas = {**_performance_pragmas(self._path), **(pragmas or {})}
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
         self._connection.row_factory = sqlite3.Row
         self._enable_pragmas()
         self._create_schema()
+        # task_types rows are never deleted, so name -> id stays valid for the store's lifetime.
+        self._task_type_ids: dict[str, int] = self._load_task_type_ids()
+        # Queries use their own read-only connection so WAL lets them run alongside writes.
+        self._read_connection, self._read_lock = self._open_read_connection()
+        # Background writer for insert_observation_async, started on first use.
+        self._write_queue: queue.SimpleQueue[_PendingWrite | None] = queue.SimpleQueue()
+        self._writer: Thread | None = None
+        self._closed = False
 
     def __enter__(self) -> SQLiteCalibrationStore:
         """Allow `with SQLiteCalibrationStore(...) as store:` usage."""
@@ -60,74 +110,120 @@ class SQLiteCalibrationStore:
         self.close()
 
     def close(self) -> None:
-        """Close the backing SQLite connection."""
+        """Flush queued async writes, then close the backing SQLite connection."""
+        with self._lock:
+            # Set under the lock so no insert_observation_async can enqueue behind the sentinel.
+            self._closed = True
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
         with self._lock:
+            try:
+                # Refresh planner statistics for the indexes when they are stale; cheap otherwise.
+                self._connection.execute("PRAGMA optimize")
+            except sqlite3.ProgrammingError:
+                pass  # already closed
             self._connection.close()
+        if self._read_connection is not self._connection:
+            with self._read_lock:
+                self._read_connection.close()
 
     def journal_mode(self) -> str:
         """Return the active SQLite journal mode."""
-        with self._lock:
-            row = self._connection.execute("PRAGMA journal_mode").fetchone()
+        with self._read_lock:
+            row = self._read_connection.execute("PRAGMA journal_mode").fetchone()
         if row is None:
             return ""
         return str(row[0]).lower()
 
     def insert_observation(self, observation: ObservationInput) -> int:
-        """Insert one observation row and return its id."""
-        _validate_observation(observation)
+        """Insert one observation row and return its id.
+
+        Observations are validated when constructed, not here.
+        """
         task_type_id = self._upsert_task_type(observation.task_type.strip())
-        observed_at = _normalize_timestamp(observation.observed_at)
-        week_start = _week_start(observed_at)
-        encoded_modifiers = json.dumps(observation.modifiers_should_have_been, sort_keys=True)
 
         with self._lock:
             with self._connection:
                 cursor = self._connection.execute(
-                    """
-                    INSERT INTO observations (
-                      task_type_id,
-                      observed_at,
-                      week_start,
-                      estimated_secs,
-                      actual_work_secs,
-                      actual_total_secs,
-                      error_ratio,
-                      file_count,
-                      line_count,
-                      test_count,
-                      project_hash,
-                      spec_clarity_modifier,
-                      warm_context_modifier,
-                      execution_mode,
-                      review_mode,
-                      review_overhead_secs,
-                      verdict,
-                      modifiers_should_have_been
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        task_type_id,
-                        observed_at,
-                        week_start,
-                        observation.estimated_secs,
-                        observation.actual_work_secs,
-                        observation.actual_total_secs,
-                        observation.error_ratio,
-                        observation.file_count,
-                        observation.line_count,
-                        observation.test_count,
-                        observation.project_hash,
-                        observation.spec_clarity_modifier,
-                        observation.warm_context_modifier,
-                        observation.execution_mode,
-                        observation.review_mode,
-                        observation.review_overhead_secs,
-                        observation.verdict,
-                        encoded_modifiers,
-                    ),
+                    _INSERT_OBSERVATION_SQL,
+                    _observation_row(observation, task_type_id),
                 )
         return int(cursor.lastrowid)
 
+    def insert_observations(self, observations: Sequence[ObservationInput]) -> list[int]:
+        """Insert many observations in one transaction and return their ids in order."""
+        if not observations:
+            return []
+
+        with self._lock:
+            with self._connection:
+                task_type_ids = self._resolve_task_type_ids(
+                    {observation.task_type.strip() for observation in observations},
+                )
+                rows = [
+                    _observation_row(observation, task_type_ids[observation.task_type.strip()])
+                    for observation in observations
+                ]
+                self._connection.executemany(_INSERT_OBSERVATION_SQL, rows)
+                # executemany does not set lastrowid; the rows are contiguous because the
+                # write transaction holds the database lock and ids use AUTOINCREMENT.
+                last_id = int(self._connection.execute("SELECT last_insert_rowid()").fetchone()[0])
+            # Only cache ids once the transaction that may have created them has committed.
+            self._task_type_ids.update(task_type_ids)
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def insert_observation_async(self, observation: ObservationInput) -> Future[int]:
+        """Queue one observation for the background writer and return a future row id.
+
+        The writer commits queued observations in batches of up to
+        ``_WRITER_BATCH_SIZE`` rows; a failed batch fails every future in it.
+        Raises ``sqlite3.ProgrammingError`` once the store is closed.
+        """
+        future: Future[int] = Future()
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot queue writes on a closed calibration store.")
+            if self._writer is None:
+                self._writer = Thread(
+                    target=self._writer_loop,
+                    name="sqlite-calibration-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._write_queue.put((observation, future))
+        return future
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._write_queue.get()
+            stop = item is None
+            batch = [] if stop else [item]
+            while not stop and len(batch) < _WRITER_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get(timeout=_WRITER_BATCH_WAIT_SECONDS)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        try:
+            row_ids = self.insert_observations([observation for observation, _ in batch])
+        except Exception as exc:  # noqa: BLE001 - reported through the futures, as executors do
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), row_id in zip(batch, row_ids):
+            future.set_result(row_id)
+
     def _query_observations(
         self,
         *,
@@ -139,137 +235,204 @@ class SQLiteCalibrationStore:
         params: list[Any] = []
 
         if task_type is not None:
-            clauses.append("task_types.name = ?")
+            clauses.append("observations.task_type_id = (SELECT id FROM task_types WHERE name = ?)")
             params.append(task_type)
         if week_start is not None:
             clauses.append("observations.week_start = ?")
             params.append(week_start)
 
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._fetch_dicts(
+            f"""
+            SELECT
+              observations.id,
+              observations.task_type_id AS task_type,
+              observations.observed_at,
+              observations.week_start,
+              observations.estimated_secs,
+              observations.actual_work_secs,
+              observations.actual_total_secs,
+              observations.error_ratio,
+              observations.file_count,
+              observations.line_count,
+              observations.test_count,
+              observations.project_hash,
+              observations.spec_clarity_modifier,
+              observations.warm_context_modifier,
+              observations.execution_mode,
+              observations.review_mode,
+              observations.review_overhead_secs,
+              observations.verdict,
+              observations.modifiers_should_have_been
+            FROM observations
+            {where_sql}
+            ORDER BY observations.observed_at ASC
+            """,
+            params,
+        )
+        # Resolve names from the cached task types instead of joining every row.
+        names = {type_id: name for name, type_id in self._task_type_ids.copy().items()}
+        if any(row["task_type"] not in names for row in rows):
+            names.update(self._fetch_task_type_names())
+        for row in rows:
+            row["task_type"] = names[row["task_type"]]
+        return rows
+
+    def _fetch_task_type_names(self) -> dict[int, str]:
+        with self._read_lock:
+            rows = self._read_connection.execute("SELECT id, name FROM task_types").fetchall()
+        return {int(row["id"]): str(row["name"]) for row in rows}
+
+    def calibrate(self, *, full: bool = False) -> None:
+        """Bring calibration_summary up to date with the raw observations table.
+
+        Only (week, task type) groups that received observations since the
+        previous calibration are recomputed and upserted. ``full=True`` rebuilds
+        every summary row from scratch.
+        """
+        if sqlite3.sqlite_version_info < _WINDOW_FUNCTIONS_MIN_VERSION:
+            self._calibrate_in_python()
+            return
         with self._lock:
-            rows = self._connection.execute(
-                f"""
-                SELECT
-                  observations.id,
-                  task_types.name AS task_type,
-                  observations.observed_at,
-                  observations.week_start,
-                  observations.estimated_secs,
-                  observations.actual_work_secs,
-                  observations.actual_total_secs,
-                  observations.error_ratio,
-                  observations.file_count,
-                  observations.line_count,
-                  observations.test_count,
-                  observations.project_hash,
-                  observations.spec_clarity_modifier,
-                  observations.warm_context_modifier,
-                  observations.execution_mode,
-                  observations.review_mode,
-                  observations.review_overhead_secs,
-                  observations.verdict,
-                  observations.modifiers_should_have_been
-                FROM observations
-                INNER JOIN task_types ON task_types.id = observations.task_type_id
-                {where_sql}
-                ORDER BY observations.observed_at ASC
-                """,
-                params,
-            ).fetchall()
-        return [dict(row) for row in rows]
-
-    def calibrate(self) -> None:
-        """Recompute calibration_summary from the raw observations table."""
-        grouped: dict[tuple[str, int], list[float]] = {}
+            with self._connection:
+                latest_id = self._latest_observation_id()
+                calibrated_id = 0 if full else self._calibrated_observation_id()
+                if full:
+                    self._connection.execute("DELETE FROM calibration_summary")
+                elif latest_id == calibrated_id:
+                    return
+                self._connection.execute(_CALIBRATE_SUMMARY_SQL, (calibrated_id,))
+                self._set_calibrated_observation_id(latest_id)
+
+    def _calibrate_in_python(self) -> None:
+        """Fallback for SQLite builds without window functions (< 3.25).
+
+        Rows stream from the cursor in group order, so only one group's values
+        are held in memory at a time.
+        """
+        summary_rows = []
         with self._lock:
-            rows = self._connection.execute(
+            latest_id = self._latest_observation_id()
+            cursor = self._connection.cursor()
+            cursor.row_factory = None
+            cursor.execute(
                 """
-                SELECT week_start, task_type_id, error_ratio
+                SELECT week_start, task_type_id, error_ratio * 100.0
                 FROM observations
-                ORDER BY week_start ASC, task_type_id ASC
+                WHERE id <= ?
+                ORDER BY week_start ASC, task_type_id ASC, error_ratio ASC
                 """,
-            ).fetchall()
-
-        for row in rows:
-            key = (str(row["week_start"]), int(row["task_type_id"]))
-            grouped.setdefault(key, []).append(float(row["error_ratio"]) * 100.0)
+                (latest_id,),
+            )
+            for (week_start, task_type_id), group in itertools.groupby(cursor, itemgetter(0, 1)):
+                values = [row[2] for row in group]
+                p10, median_error_pct, p90 = _percentiles(values, (10.0, 50.0, 90.0))
+                summary_rows.append(
+                    (week_start, task_type_id, median_error_pct, p10, p90, len(values)),
+                )
 
-        with self._lock:
             with self._connection:
                 self._connection.execute("DELETE FROM calibration_summary")
-                for (week_start, task_type_id), values in grouped.items():
-                    median_error_pct = _percentile(values, 50.0)
-                    p10 = _percentile(values, 10.0)
-                    p90 = _percentile(values, 90.0)
+                self._set_calibrated_observation_id(latest_id)
+                # One multi-row INSERT per chunk instead of one statement per group.
+                for start in range(0, len(summary_rows), _SUMMARY_ROWS_PER_INSERT):
+                    chunk = summary_rows[start : start + _SUMMARY_ROWS_PER_INSERT]
                     self._connection.execute(
-                        """
-                        INSERT INTO calibration_summary (
-                          week_start,
-                          task_type_id,
-                          median_error_pct,
-                          p10,
-                          p90,
-                          sample_count
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            week_start,
-                            task_type_id,
-                            median_error_pct,
-                            p10,
-                            p90,
-                            len(values),
-                        ),
+                        _INSERT_SUMMARY_ROWS_SQL + ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk)),
+                        [value for row in chunk for value in row],
                     )
 
+    def _latest_observation_id(self) -> int:
+        row = self._connection.execute("SELECT COALESCE(MAX(id), 0) FROM observations").fetchone()
+        return int(row[0])
+
+    def _calibrated_observation_id(self) -> int:
+        row = self._connection.execute(
+            "SELECT last_observation_id FROM calibration_watermark WHERE id = 1",
+        ).fetchone()
+        return 0 if row is None else int(row[0])
+
+    def _set_calibrated_observation_id(self, observation_id: int) -> None:
+        # Not an UPSERT: _calibrate_in_python also runs on SQLite < 3.24, which lacks one.
+        self._connection.execute(
+            "INSERT OR REPLACE INTO calibration_watermark (id, last_observation_id) VALUES (1, ?)",
+            (observation_id,),
+        )
+
     def query_calibration_summary(self) -> list[dict[str, Any]]:
         """Return all aggregate rows from calibration_summary."""
-        with self._lock:
-            rows = self._connection.execute(
-                """
-                SELECT
-                  calibration_summary.week_start,
-                  task_types.name AS task_type,
-                  calibration_summary.median_error_pct,
-                  calibration_summary.p10,
-                  calibration_summary.p90,
-                  calibration_summary.sample_count
-                FROM calibration_summary
-                INNER JOIN task_types ON task_types.id = calibration_summary.task_type_id
-                ORDER BY calibration_summary.week_start ASC, task_types.name ASC
-                """,
-            ).fetchall()
-        return [dict(row) for row in rows]
+        return self._fetch_dicts(_SELECT_SUMMARY_SQL, (0,))
 
     def export_calibration_summary(self, *, allow_export: bool = False) -> list[dict[str, Any]]:
         """Export only aggregate data, gated by explicit allow_export."""
+        return list(self.iter_export_calibration_summary(allow_export=allow_export))
+
+    def iter_export_calibration_summary(
+        self,
+        *,
+        allow_export: bool = False,
+        batch_size: int = _EXPORT_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream export rows in ``fetchmany`` batches instead of building a list.
+
+        The allow_export check runs immediately, not on first iteration.
+        """
         if not allow_export:
             raise PermissionError("Export is disabled by default. Pass allow_export=True to export.")
 
-        with self._lock:
-            rows = self._connection.execute(
-                """
-                SELECT
-                  calibration_summary.week_start,
-                  task_types.name AS task_type,
-                  calibration_summary.median_error_pct,
-                  calibration_summary.p10,
-                  calibration_summary.p90,
-                  calibration_summary.sample_count
-                FROM calibration_summary
-                INNER JOIN task_types ON task_types.id = calibration_summary.task_type_id
-                WHERE calibration_summary.sample_count >= ?
-                ORDER BY calibration_summary.week_start ASC, task_types.name ASC
-                """,
-                (self._k_anonymity_floor,),
-            ).fetchall()
-        return [dict(row) for row in rows]
+        return self._iter_dicts(_SELECT_SUMMARY_SQL, (self._k_anonymity_floor,), batch_size)
+
+    def _fetch_dicts(self, sql: str, params: Sequence[Any]) -> list[dict[str, Any]]:
+        """Run a read query and return dict rows, resolving column names once per query."""
+        with self._read_lock:
+            cursor = self._read_connection.cursor()
+            cursor.row_factory = None  # plain tuples; skip building sqlite3.Row objects
+            rows = cursor.execute(sql, params).fetchall()
+            keys = [column[0] for column in cursor.description]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _iter_dicts(
+        self,
+        sql: str,
+        params: Sequence[Any],
+        batch_size: int,
+    ) -> Iterator[dict[str, Any]]:
+        # The read lock is held per batch, never across a yield.
+        with self._read_lock:
+            cursor = self._read_connection.cursor()
+            cursor.row_factory = None
+            cursor.execute(sql, params)
+            keys = [column[0] for column in cursor.description]
+        while True:
+            with self._read_lock:
+                batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return
+            for row in batch:
+                yield dict(zip(keys, row))
+
+    def _open_read_connection(self) -> tuple[sqlite3.Connection, Lock]:
+        if str(self._path) == ":memory:":
+            # A second connection would open a different in-memory database.
+            return self._connection, self._lock
+        connection = sqlite3.connect(
+            f"{self._path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA query_only=1")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection, Lock()
 
     def _enable_pragmas(self) -> None:
         with self._lock:
             self._connection.execute("PRAGMA journal_mode=WAL")
             self._connection.execute("PRAGMA foreign_keys=ON")
             self._connection.execute("PRAGMA busy_timeout=5000")
+            for name, value in self._pragmas.items():
+                self._connection.execute(f"PRAGMA {name}={value}")
 
     def _create_schema(self) -> None:
         with self._lock:
@@ -308,6 +471,21 @@ class SQLiteCalibrationStore:
                     )
                     """,
                 )
+                # calibrate() groups by (week_start, task_type_id); per-type queries
+                # filter by task_type_id and order by observed_at. calibration_summary's
+                # UNIQUE constraint already indexes (week_start, task_type_id).
+                self._connection.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_obs_week_task
+                    ON observations (week_start, task_type_id)
+                    """,
+                )
+                self._connection.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_obs_task_observed
+                    ON observations (task_type_id, observed_at)
+                    """,
+                )
                 self._connection.execute(
                     """
                     CREATE TABLE IF NOT EXISTS calibration_summary (
@@ -324,6 +502,16 @@ class SQLiteCalibrationStore:
                     )
                     """,
                 )
+                # Highest observation id already reflected in calibration_summary.
+                # Observations are append-only, so newer ids mark the stale groups.
+                self._connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS calibration_watermark (
+                      id INTEGER PRIMARY KEY CHECK (id = 1),
+                      last_observation_id INTEGER NOT NULL
+                    )
+                    """,
+                )
                 self._connection.execute(
                     """
                     CREATE TABLE IF NOT EXISTS schema_version (
@@ -338,23 +526,208 @@ class SQLiteCalibrationStore:
                     """,
                 )
 
+    def _load_task_type_ids(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute("SELECT id, name FROM task_types").fetchall()
+        return {str(row["name"]): int(row["id"]) for row in rows}
+
+    def _resolve_task_type_ids(self, names: set[str]) -> dict[str, int]:
+        """Return ids for ``names``, inserting missing task types.
+
+        The caller holds the lock and an open transaction, and adds the result
+        to the id cache after committing.
+        """
+        cache = self._task_type_ids
+        resolved = {name: cache[name] for name in names if name in cache}
+        missing = tuple(names - resolved.keys())
+        if not missing:
+            return resolved
+        self._connection.executemany(
+            _INSERT_TASK_TYPE_SQL,
+            [(name,) for name in missing],
+        )
+        placeholders = ", ".join("?" for _ in missing)
+        rows = self._connection.execute(
+            f"SELECT id, name FROM task_types WHERE name IN ({placeholders})",
+            missing,
+        ).fetchall()
+        resolved.update((str(row["name"]), int(row["id"])) for row in rows)
+        return resolved
+
     def _upsert_task_type(self, task_type: str) -> int:
         if not task_type:
             raise ValueError("task_type must be non-empty")
 
         with self._lock:
+            cached = self._task_type_ids.get(task_type)
+            if cached is not None:
+                return cached
             with self._connection:
-                self._connection.execute(
-                    "INSERT OR IGNORE INTO task_types (name) VALUES (?)",
-                    (task_type,),
-                )
-            row = self._connection.execute(
-                "SELECT id FROM task_types WHERE name = ?",
-                (task_type,),
-            ).fetchone()
-        if row is None:
-            raise RuntimeError(f"Failed to resolve task type id for '{task_type}'")
-        return int(row["id"])
+                self._connection.execute(_INSERT_TASK_TYPE_SQL, (task_type,))
+            row = self._connection.execute(_SELECT_TASK_TYPE_ID_SQL, (task_type,)).fetchone()
+            if row is None:
+                raise RuntimeError(f"Failed to resolve task type id for '{task_type}'")
+            task_type_id = int(row["id"])
+            self._task_type_ids[task_type] = task_type_id
+        return task_type_id
+
+
+_PendingWrite = tuple[ObservationInput, "Future[int]"]
+_WRITER_BATCH_SIZE = 500
+_WRITER_BATCH_WAIT_SECONDS = 0.05
+
+# Write-throughput tuning applied after WAL is enabled. synchronous=NORMAL is
+# durable against application crashes in WAL mode; pass
+# pragmas={"synchronous": "FULL"} when power-loss durability matters.
+DEFAULT_PRAGMAS: Mapping[str, str | int] = MappingProxyType(
+    {
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -65536,  # 64 MiB
+        "mmap_size": 268435456,  # 256 MiB
+    },
+)
+
+# sqlite3 reuses a prepared statement only when the SQL text is identical, so the
+# per-call statements live here as shared constants.
+_STATEMENT_CACHE_SIZE = 256
+
+_INSERT_TASK_TYPE_SQL = "INSERT OR IGNORE INTO task_types (name) VALUES (?)"
+_SELECT_TASK_TYPE_ID_SQL = "SELECT id FROM task_types WHERE name = ?"
+
+# Prefix for multi-row summary inserts; append one "(?, ?, ?, ?, ?, ?)" per row.
+# Chunks stay under the 999-variable limit of SQLite builds older than 3.32.
+_INSERT_SUMMARY_ROWS_SQL = """
+INSERT INTO calibration_summary (
+  week_start,
+  task_type_id,
+  median_error_pct,
+  p10,
+  p90,
+  sample_count
+) VALUES """
+_SUMMARY_ROWS_PER_INSERT = 999 // 6
+
+# Parameter: minimum sample_count (0 for all rows, the k-anonymity floor for export).
+_SELECT_SUMMARY_SQL = """
+SELECT
+  calibration_summary.week_start,
+  task_types.name AS task_type,
+  calibration_summary.median_error_pct,
+  calibration_summary.p10,
+  calibration_summary.p90,
+  calibration_summary.sample_count
+FROM calibration_summary
+INNER JOIN task_types ON task_types.id = calibration_summary.task_type_id
+WHERE calibration_summary.sample_count >= ?
+ORDER BY calibration_summary.week_start ASC, task_types.name ASC
+"""
+
+# week_start is the Monday of observed_at's calendar week. It is derived in SQL
+# from the local date prefix (not converted to UTC), so observed_at is bound twice.
+_INSERT_OBSERVATION_SQL = """
+INSERT INTO observations (
+  task_type_id,
+  observed_at,
+  week_start,
+  estimated_secs,
+  actual_work_secs,
+  actual_total_secs,
+  error_ratio,
+  file_count,
+  line_count,
+  test_count,
+  project_hash,
+  spec_clarity_modifier,
+  warm_context_modifier,
+  execution_mode,
+  review_mode,
+  review_overhead_secs,
+  verdict,
+  modifiers_should_have_been
+) VALUES (
+  ?,
+  ?,
+  date(substr(?, 1, 10), 'weekday 0', '-6 days'),
+  ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+)
+"""
+
+
+_WINDOW_FUNCTIONS_MIN_VERSION = (3, 25, 0)
+
+# Per (week_start, task_type_id) group: rank rows by error_ratio, then apply the
+# same linear interpolation as _percentile. For percentile p over n values the
+# fractional rank is (n - 1) * p; idx is the 0-based sorted position. Only groups
+# holding an observation with id > the parameter are recomputed and upserted.
+_CALIBRATE_SUMMARY_SQL = """
+WITH ranked AS (
+  SELECT
+    week_start,
+    task_type_id,
+    error_ratio * 100.0 AS value,
+    ROW_NUMBER() OVER (
+      PARTITION BY week_start, task_type_id ORDER BY error_ratio
+    ) - 1 AS idx,
+    COUNT(*) OVER (PARTITION BY week_start, task_type_id) AS n
+  FROM observations
+  WHERE EXISTS (
+    SELECT 1
+    FROM observations AS changed
+    WHERE changed.week_start = observations.week_start
+      AND changed.task_type_id = observations.task_type_id
+      AND changed.id > ?
+  )
+),
+ranks AS (
+  SELECT
+    *,
+    (n - 1) * 0.1 AS r10,
+    (n - 1) * 0.5 AS r50,
+    (n - 1) * 0.9 AS r90
+  FROM ranked
+),
+bounds AS (
+  SELECT
+    week_start,
+    task_type_id,
+    n,
+    MAX(r10 - CAST(r10 AS INTEGER)) AS f10,
+    MAX(CASE WHEN idx = CAST(r10 AS INTEGER) THEN value END) AS lo10,
+    MAX(CASE WHEN idx = CAST(r10 AS INTEGER) + 1 THEN value END) AS hi10,
+    MAX(r50 - CAST(r50 AS INTEGER)) AS f50,
+    MAX(CASE WHEN idx = CAST(r50 AS INTEGER) THEN value END) AS lo50,
+    MAX(CASE WHEN idx = CAST(r50 AS INTEGER) + 1 THEN value END) AS hi50,
+    MAX(r90 - CAST(r90 AS INTEGER)) AS f90,
+    MAX(CASE WHEN idx = CAST(r90 AS INTEGER) THEN value END) AS lo90,
+    MAX(CASE WHEN idx = CAST(r90 AS INTEGER) + 1 THEN value END) AS hi90
+  FROM ranks
+  GROUP BY week_start, task_type_id, n
+)
+INSERT INTO calibration_summary (
+  week_start,
+  task_type_id,
+  median_error_pct,
+  p10,
+  p90,
+  sample_count
+)
+SELECT
+  week_start,
+  task_type_id,
+  lo50 + (COALESCE(hi50, lo50) - lo50) * f50,
+  lo10 + (COALESCE(hi10, lo10) - lo10) * f10,
+  lo90 + (COALESCE(hi90, lo90) - lo90) * f90,
+  n
+FROM bounds
+WHERE true
+ON CONFLICT (week_start, task_type_id) DO UPDATE SET
+  median_error_pct = excluded.median_error_pct,
+  p10 = excluded.p10,
+  p90 = excluded.p90,
+  sample_count = excluded.sample_count,
+  updated_at = CURRENT_TIMESTAMP
+"""
 
 
 def calibrate(path: str | Path) -> list[dict[str, Any]]:
@@ -378,6 +751,19 @@ def _validate_observation(observation: ObservationInput) -> None:
         raise ValueError("review_mode must be non-empty")
     if not observation.verdict.strip():
         raise ValueError("verdict must be non-empty")
+    if observation.observed_at is not None:
+        # week_start is derived in SQL from the first ten characters, so they must be
+        # an extended YYYY-MM-DD date; basic and week-date forms parse here but not there.
+        message = (
+            "observed_at must be an ISO 8601 timestamp starting with YYYY-MM-DD, "
+            f"got {observation.observed_at!r}"
+        )
+        try:
+            parsed = datetime.fromisoformat(observation.observed_at.replace("Z", "+00:00"))
+        except ValueError as exc:
+            raise ValueError(message) from exc
+        if parsed.date().isoformat() != observation.observed_at[:10]:
+            raise ValueError(message)
 
     for name, value in (
         ("estimated_secs", observation.estimated_secs),
@@ -402,6 +788,67 @@ def _validate_observation(observation: ObservationInput) -> None:
             raise ValueError("modifiers_should_have_been keys must be non-empty")
         if not isinstance(value, (int, float)):
             raise ValueError("modifiers_should_have_been values must be numeric")
+        if not math.isfinite(value):
+            raise ValueError("modifiers_should_have_been values must be finite")
+
+
+def _performance_pragmas(path: Path) -> dict[str, str | int]:
+    if str(path) == ":memory:":
+        # No WAL or file pages to map for in-memory databases.
+        return {
+            name: value
+            for name, value in DEFAULT_PRAGMAS.items()
+            if name not in {"synchronous", "mmap_size"}
+        }
+    return dict(DEFAULT_PRAGMAS)
+
+
+# Observation fields bound verbatim, in _INSERT_OBSERVATION_SQL column order; one
+# C-level call instead of an attribute lookup per column.
+_OBSERVATION_PLAIN_FIELDS = attrgetter(
+    "estimated_secs",
+    "actual_work_secs",
+    "actual_total_secs",
+    "error_ratio",
+    "file_count",
+    "line_count",
+    "test_count",
+    "project_hash",
+    "spec_clarity_modifier",
+    "warm_context_modifier",
+    "execution_mode",
+    "review_mode",
+    "review_overhead_secs",
+    "verdict",
+)
+
+
+def _observation_row(observation: ObservationInput, task_type_id: int) -> tuple[Any, ...]:
+    """Build the parameter tuple for ``_INSERT_OBSERVATION_SQL``."""
+    observed_at = _normalize_timestamp(observation.observed_at)
+    return (
+        task_type_id,
+        observed_at,
+        observed_at,
+        *_OBSERVATION_PLAIN_FIELDS(observation),
+        _encode_modifiers(observation.modifiers_should_have_been),
+    )
+
+
+def _encode_modifiers(modifiers: dict[str, float]) -> str:
+    """Serialize modifiers as compact, key-sorted JSON; identical with or without orjson.
+
+    orjson has no separator options, so both paths write compact JSON rather than
+    the ``", "``/``": "`` form stored by earlier releases; readers parse either.
+    Values must be finite (checked by ``_validate_observation``): orjson writes
+    NaN as ``null`` where json writes a bare ``NaN``.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            modifiers,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(modifiers, sort_keys=True, separators=(",", ":"))
 
 
 def _normalize_timestamp(value: str | None) -> str:
@@ -410,28 +857,29 @@ def _normalize_timestamp(value: str | None) -> str:
     return value
 
 
-def _week_start(timestamp: str) -> str:
-    normalized = timestamp.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(normalized)
-    monday = (dt - timedelta(days=dt.weekday())).date()
-    return monday.isoformat()
+def _percentile(values: list[float], percent: float) -> float:
+    return _percentiles(values, (percent,))[0]
 
 
-def _percentile(values: list[float], percent: float) -> float:
+def _percentiles(values: list[float], percents: Sequence[float]) -> tuple[float, ...]:
+    """Linear-interpolated percentiles of ``values``, sorting them once."""
     if not values:
         raise ValueError("percentile requires at least one value")
     if len(values) == 1:
-        return values[0]
+        return tuple(values[0] for _ in percents)
 
     sorted_values = sorted(values)
-    rank = (len(sorted_values) - 1) * (percent / 100.0)
-    lower_index = int(rank)
-    upper_index = min(lower_index + 1, len(sorted_values) - 1)
-
-    if lower_index == upper_index:
-        return sorted_values[lower_index]
-
-    lower_value = sorted_values[lower_index]
-    upper_value = sorted_values[upper_index]
-    fraction = rank - lower_index
-    return lower_value + (upper_value - lower_value) * fraction
+    last_index = len(sorted_values) - 1
+    results: list[float] = []
+    for percent in percents:
+        rank = last_index * (percent / 100.0)
+        lower_index = int(rank)
+        upper_index = min(lower_index + 1, last_index)
+        lower_value = sorted_values[lower_index]
+        if lower_index == upper_index:
+            results.append(lower_value)
+            continue
+        upper_value = sorted_values[upper_index]
+        fraction = rank - lower_index
+        results.append(lower_value + (upper_value - lower_value) * fraction)
+    return tuple(results)
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
-from typing import NoReturn, Sequence
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Mapping, Sequence
 
+from agent_estimate.cli.commands._util import exit_with_error
 from agent_estimate.core import (
+    AgentProfile,
     EstimationCategory,
     EstimationConfig,
     ReviewMode,
     TaskEstimate,
     TaskNode,
     TaskType,
+    Wave,
     WavePlan,
     auto_correct_tier,
     classify_task,
@@ -24,7 +30,7 @@ from agent_estimate.core import (
     estimate_config_sre,
     estimate_documentation,
     estimate_research,
-    estimate_task,
+    estimate_task_with_human_equivalent,
     load_metr_thresholds,
     plan_waves,
 )
@@ -41,22 +47,66 @@ logger = logging.getLogger("agent_estimate")
 _MINUTES_PER_TURN = 5.0
 
 
-def _error(message: str, exit_code: int) -> NoReturn:
-    """Print error to stderr and exit."""
-    import typer
+@dataclass(frozen=True, slots=True)
+class _AgentIndex:
+    """Per-agent lookups built once from ``config.agents``.
 
-    typer.echo(f"Error: {message}", err=True)
-    raise typer.Exit(code=exit_code)
+    ``names``, ``tiers`` and ``costs`` follow ``config.agents`` positions;
+    ``by_name`` maps each name to its last position, matching
+    dict-comprehension semantics when names repeat.
+    """
+
+    names: tuple[str, ...]
+    tiers: tuple[str, ...]
+    costs: tuple[float, ...]
+    by_name: dict[str, int]
+    default_name: str
+    default_tier: str
+
+    @classmethod
+    def from_agents(cls, agents: Sequence[AgentProfile]) -> _AgentIndex:
+        by_name: dict[str, int] = {}
+        names: list[str] = []
+        tiers: list[str] = []
+        costs: list[float] = []
+        for position, agent in enumerate(agents):
+            by_name[agent.name] = position
+            names.append(agent.name)
+            tiers.append(agent.model_tier)
+            costs.append(agent.cost_per_turn)
+        return cls(
+            names=tuple(names),
+            tiers=tuple(tiers),
+            costs=tuple(costs),
+            by_name=by_name,
+            default_name=agents[0].name,
+            default_tier=agents[0].model_tier,
+        )
 
 
 def _truncate_name(desc: str, max_len: int = 60) -> str:
     """Truncate a task description for table readability."""
-    desc = desc.strip().split("\n", 1)[0]
+    # strip() returns the same object when there is nothing to strip, and
+    # find() avoids split()'s list for the common single-line description.
+    desc = desc.strip()
+    newline = desc.find("\n")
+    if newline != -1:
+        desc = desc[:newline]
     if len(desc) <= max_len:
         return desc
     return desc[: max_len - 1] + "\u2026"
 
 
+# Flat-model estimators for the non-coding categories; CODING falls through
+# to the PERT tier model in _estimate_by_category.
+_NON_CODING_ESTIMATORS = {
+    EstimationCategory.BRAINSTORM: estimate_brainstorm,
+    EstimationCategory.RESEARCH: estimate_research,
+    EstimationCategory.CONFIG_SRE: estimate_config_sre,
+    EstimationCategory.DOCUMENTATION: estimate_documentation,
+}
+
+
 def _estimate_by_category(
     category: EstimationCategory,
     desc: str,
@@ -79,50 +129,9 @@ def _estimate_by_category(
     """
     task_tier_warnings: list[str] = []
 
-    if category == EstimationCategory.BRAINSTORM:
-        est = estimate_brainstorm(
-            desc,
-            modifiers,
-            review_mode=review_mode,
-            model_key=model_key,
-            thresholds=thresholds,
-            fallback_threshold=fallback,
-            agent_name=agent_name,
-        )
-        human_eq = compute_human_equivalent(est.total_expected_minutes, TaskType.UNKNOWN)
-        est = replace(est, human_equivalent_minutes=human_eq)
-        return est, task_tier_warnings
-
-    if category == EstimationCategory.RESEARCH:
-        est = estimate_research(
-            desc,
-            modifiers,
-            review_mode=review_mode,
-            model_key=model_key,
-            thresholds=thresholds,
-            fallback_threshold=fallback,
-            agent_name=agent_name,
-        )
-        human_eq = compute_human_equivalent(est.total_expected_minutes, TaskType.UNKNOWN)
-        est = replace(est, human_equivalent_minutes=human_eq)
-        return est, task_tier_warnings
-
-    if category == EstimationCategory.CONFIG_SRE:
-        est = estimate_config_sre(
-            desc,
-            modifiers,
-            review_mode=review_mode,
-            model_key=model_key,
-            thresholds=thresholds,
-            fallback_threshold=fallback,
-            agent_name=agent_name,
-        )
-        human_eq = compute_human_equivalent(est.total_expected_minutes, TaskType.UNKNOWN)
-        est = replace(est, human_equivalent_minutes=human_eq)
-        return est, task_tier_warnings
-
-    if category == EstimationCategory.DOCUMENTATION:
-        est = estimate_documentation(
+    non_coding_estimator = _NON_CODING_ESTIMATORS.get(category)
+    if non_coding_estimator is not None:
+        est = non_coding_estimator(
             desc,
             modifiers,
             review_mode=review_mode,
@@ -149,8 +158,7 @@ def _estimate_by_category(
                 task_tier_warnings.append(w)
         sizing = correction.sizing
 
-    # First pass — get total_expected_minutes
-    est = estimate_task(
+    est = estimate_task_with_human_equivalent(
         sizing,
         modifiers,
         review_mode=review_mode,
@@ -158,22 +166,55 @@ def _estimate_by_category(
         thresholds=thresholds,
         fallback_threshold=fallback,
         agent_name=agent_name,
+        estimation_category=EstimationCategory.CODING,
     )
-    # Compute human equivalent and re-estimate with it filled in
-    human_eq = compute_human_equivalent(est.total_expected_minutes, sizing.task_type)
-    est = estimate_task(
-        sizing,
+    return est, task_tier_warnings
+
+
+def _estimate_description(
+    desc: str,
+    *,
+    task_category: EstimationCategory | None,
+    modifiers,
+    review_mode: ReviewMode,
+    model_key: str,
+    thresholds,
+    fallback: float,
+    agent_name: str | None,
+    auto_tier: bool,
+    estimated_tests: int | None,
+    estimated_lines: int | None,
+    num_concerns: int | None,
+) -> tuple[str, TaskEstimate, list[str]]:
+    """Estimate one description; returns (name, estimate, tier_warnings)."""
+    name = _truncate_name(desc)
+    logger.debug("Estimating task: %s", name)
+
+    # Determine the estimation category for this task
+    if task_category is not None:
+        category = task_category
+    else:
+        category = detect_estimation_category(desc)
+
+    # classify_task runs the PERT coding model; skip it for non-coding categories
+    sizing = classify_task(desc) if category is EstimationCategory.CODING else None
+
+    est, task_tier_warnings = _estimate_by_category(
+        category,
+        desc,
         modifiers,
         review_mode=review_mode,
         model_key=model_key,
         thresholds=thresholds,
-        fallback_threshold=fallback,
+        fallback=fallback,
         agent_name=agent_name,
-        human_equivalent_minutes=human_eq,
+        sizing=sizing,
+        auto_tier=auto_tier,
+        estimated_tests=estimated_tests,
+        estimated_lines=estimated_lines,
+        num_concerns=num_concerns,
     )
-    # Attach category to the estimate
-    est = replace(est, estimation_category=EstimationCategory.CODING)
-    return est, task_tier_warnings
+    return name, est, task_tier_warnings
 
 
 def run_estimate_pipeline(
@@ -190,59 +231,66 @@ def run_estimate_pipeline(
     estimated_lines: int | None = None,
     num_concerns: int | None = None,
     task_category: EstimationCategory | None = None,
+    max_workers: int = 1,
+    thresholds: Mapping[str, float] | None = None,
 ) -> EstimationReport:
-    """Run the full estimation pipeline and produce a report."""
+    """Run the full estimation pipeline and produce a report.
+
+    ``max_workers > 1`` estimates descriptions on a thread pool; results keep
+    input order. The built-in estimators are CPU-bound, so this only pays off
+    when a plugged-in estimator blocks on I/O. Repeated descriptions are
+    estimated once and share the resulting (frozen) estimate.
+
+    ``thresholds`` overrides the packaged METR thresholds; callers running
+    many pipelines can load them once and pass the same mapping to each run.
+    """
     if not config.agents:
-        _error("config.agents must be non-empty", 2)
+        exit_with_error("config.agents must be non-empty", 2)
 
-    thresholds = load_metr_thresholds()
+    if thresholds is None:
+        thresholds = load_metr_thresholds()
+    agent_index = _AgentIndex.from_agents(config.agents)
     # Use first agent's tier for initial estimation pass; METR warnings are
     # corrected per-task after wave planning assigns each task to an agent.
-    initial_model_key = config.agents[0].model_tier
-    initial_agent_name = config.agents[0].name
+    initial_model_key = agent_index.default_tier
+    initial_agent_name = agent_index.default_name
     fallback = config.settings.metr_fallback_threshold
 
-    names: list[str] = []
-    estimates: list[TaskEstimate] = []
-    tier_warnings: list[list[str]] = []
     modifiers = build_modifier_set(
         spec_clarity=spec_clarity,
         warm_context=warm_context,
         agent_fit=agent_fit,
     )
 
-    for desc in descriptions:
-        name = _truncate_name(desc)
-        logger.debug("Estimating task: %s", name)
-
-        # Determine the estimation category for this task
-        if task_category is not None:
-            category = task_category
-        else:
-            category = detect_estimation_category(desc)
-
-        # classify_task runs the PERT coding model; skip it for non-coding categories
-        sizing = classify_task(desc) if category == EstimationCategory.CODING else None
-
-        est, task_tier_warnings = _estimate_by_category(
-            category,
-            desc,
-            modifiers,
-            review_mode=review_mode,
-            model_key=initial_model_key,
-            thresholds=thresholds,
-            fallback=fallback,
-            agent_name=initial_agent_name,
-            sizing=sizing,
-            auto_tier=auto_tier,
-            estimated_tests=estimated_tests,
-            estimated_lines=estimated_lines,
-            num_concerns=num_concerns,
-        )
-        tier_warnings.append(task_tier_warnings)
+    estimate_one = partial(
+        _estimate_description,
+        task_category=task_category,
+        modifiers=modifiers,
+        review_mode=review_mode,
+        model_key=initial_model_key,
+        thresholds=thresholds,
+        fallback=fallback,
+        agent_name=initial_agent_name,
+        auto_tier=auto_tier,
+        estimated_tests=estimated_tests,
+        estimated_lines=estimated_lines,
+        num_concerns=num_concerns,
+    )
+    # Every other estimation input is fixed for the run, so the description
+    # alone keys the result.
+    unique_descriptions = list(dict.fromkeys(descriptions))
+    if max_workers > 1 and len(unique_descriptions) > 1:
+        workers = min(max_workers, len(unique_descriptions))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            unique_results = list(pool.map(estimate_one, unique_descriptions))
+    else:
+        unique_results = [estimate_one(desc) for desc in unique_descriptions]
+    results_by_description = dict(zip(unique_descriptions, unique_results))
+    results = [results_by_description[desc] for desc in descriptions]
 
-        names.append(name)
-        estimates.append(est)
+    names = [name for name, _, _ in results]
+    estimates = [est for _, est, _ in results]
+    tier_warnings = [task_tier_warnings for _, _, task_tier_warnings in results]
 
     # Build TaskNodes for wave planning (friction applied to work only).
     # review_minutes is kept separate so the wave planner can amortize it
@@ -250,7 +298,7 @@ def run_estimate_pipeline(
     friction = config.settings.friction_multiplier
     task_nodes = [
         TaskNode(
-            task_id=str(i),
+            task_id=i,
             duration_minutes=est.pert.expected * friction,
             # review_minutes is flat additive overhead, not scaled by friction
             review_minutes=est.review_minutes,
@@ -265,50 +313,80 @@ def run_estimate_pipeline(
     )
 
     return _build_report(
-        names, estimates, wave_plan, config, title, thresholds, fallback,
+        names, estimates, wave_plan, agent_index, title, thresholds, fallback,
         warm_context_detail=warm_context_detail,
         tier_warnings=tier_warnings,
     )
 
 
+def _report_wave(wave: Wave, names: list[str]) -> ReportWave:
+    """Map one planned wave to its report model in a single pass over assignments."""
+    wave_tasks: list[str] = []
+    agent_assignments: defaultdict[str, list[str]] = defaultdict(list)
+    for a in wave.assignments:
+        task_name = names[a.task_id]
+        wave_tasks.append(task_name)
+        agent_assignments[a.agent_name].append(task_name)
+    return ReportWave(
+        number=wave.wave_number,
+        tasks=tuple(wave_tasks),
+        duration_minutes=wave.end_minutes - wave.start_minutes,
+        agent_assignments={
+            agent_name: tuple(agent_tasks) for agent_name, agent_tasks in agent_assignments.items()
+        },
+        agent_review_minutes=dict(wave.agent_review_minutes),
+    )
+
+
 def _build_report(
     names: list[str],
     estimates: list[TaskEstimate],
     wave_plan: WavePlan,
-    config: EstimationConfig,
+    agent_index: _AgentIndex,
     title: str,
-    thresholds: dict[str, float] | None = None,
+    thresholds: Mapping[str, float] | None = None,
     fallback: float = 40.0,
     warm_context_detail: str | None = None,
     tier_warnings: list[list[str]] | None = None,
 ) -> EstimationReport:
     """Map wave planner outputs back to report models."""
-    # Build assignment map: task_id -> agent_name
-    assignment_map: dict[str, str] = {}
+    # One pass over the assignments records each task's agent position and
+    # each configured agent's load (agents start at 0). The planner only
+    # assigns configured agents; unassigned tasks fall back to the default.
+    by_name = agent_index.by_name
+    default_position = by_name[agent_index.default_name]
+    assigned_positions = [default_position] * len(estimates)
+    agent_work = [0.0] * len(agent_index.tiers)
+    agent_tasks = [0] * len(agent_index.tiers)
     for wave in wave_plan.waves:
         for a in wave.assignments:
-            assignment_map[a.task_id] = a.agent_name
-
-    default_agent = config.agents[0].name
+            agent = by_name[a.agent_name]
+            assigned_positions[a.task_id] = agent
+            agent_work[agent] += a.duration_minutes
+            agent_tasks[agent] += 1
 
-    # Build agent model tier map: agent_name -> model_tier
-    agent_model_tier: dict[str, str] = {a.name: a.model_tier for a in config.agents}
-    default_tier = config.agents[0].model_tier
+    # Tasks on the default agent were estimated with exactly its model key
+    reuse_default_warning = agent_index.tiers[default_position] == agent_index.default_tier
 
     # Report tasks — re-evaluate METR warnings using the assigned agent's model tier
     report_task_list: list[ReportTask] = []
     for i, est in enumerate(estimates):
-        assigned_agent = assignment_map.get(str(i), default_agent)
-        model_tier = agent_model_tier.get(assigned_agent, default_tier)
+        agent = assigned_positions[i]
+        assigned_agent = agent_index.names[agent]
+        model_tier = agent_index.tiers[agent]
 
-        # Re-check METR threshold with the assigned agent's model tier
-        corrected_warning = check_metr_threshold(
-            model_tier,
-            est.total_expected_minutes,
-            thresholds=thresholds,
-            fallback_threshold=fallback,
-            agent_name=assigned_agent,
-        )
+        if agent == default_position and reuse_default_warning:
+            # Same model key, agent and thresholds as the estimation pass
+            corrected_warning = est.metr_warning
+        else:
+            # Re-check METR threshold with the assigned agent's model tier
+            corrected_warning = check_metr_threshold(
+                model_tier,
+                est.total_expected_minutes,
+                thresholds=thresholds,
+                fallback_threshold=fallback,
+                agent_name=assigned_agent,
+            )
         warning_message = corrected_warning.message if corrected_warning is not None else None
 
         task_tier_warnings = tier_warnings[i] if tier_warnings else []
@@ -338,34 +416,17 @@ def _build_report(
     report_tasks = tuple(report_task_list)
 
     # Report waves
-    report_waves = tuple(
-        ReportWave(
-            number=wave.wave_number,
-            tasks=tuple(names[int(a.task_id)] for a in wave.assignments),
-            duration_minutes=wave.end_minutes - wave.start_minutes,
-            agent_assignments={
-                agent_name: tuple(
-                    names[int(aa.task_id)]
-                    for aa in wave.assignments
-                    if aa.agent_name == agent_name
-                )
-                for agent_name in {a.agent_name for a in wave.assignments}
-            },
-            agent_review_minutes=dict(wave.agent_review_minutes),
-        )
-        for wave in wave_plan.waves
-    )
+    report_waves = tuple(_report_wave(wave, names) for wave in wave_plan.waves)
 
     # Timeline — scale best/worst by parallel efficiency ratio
     # pert.optimistic/pessimistic already have modifiers applied (via estimate_task)
-    total_best = sum(e.pert.optimistic + e.review_minutes for e in estimates)
-    total_expected = sum(e.total_expected_minutes for e in estimates)
-    total_worst = sum(e.pert.pessimistic + e.review_minutes for e in estimates)
-    total_human = sum(
-        e.human_equivalent_minutes
-        for e in estimates
-        if e.human_equivalent_minutes is not None
-    )
+    total_best = total_expected = total_worst = total_human = 0.0
+    for e in estimates:
+        total_best += e.pert.optimistic + e.review_minutes
+        total_expected += e.total_expected_minutes
+        total_worst += e.pert.pessimistic + e.review_minutes
+        if e.human_equivalent_minutes is not None:
+            total_human += e.human_equivalent_minutes
 
     if total_expected > 0:
         ratio = wave_plan.total_wall_clock_minutes / total_expected
@@ -379,33 +440,19 @@ def _build_report(
         human_equivalent_minutes=total_human,
     )
 
-    # Agent load — initialize all agents to 0
-    agent_work: dict[str, float] = {a.name: 0.0 for a in config.agents}
-    agent_tasks: dict[str, int] = {a.name: 0 for a in config.agents}
-    cost_per_turn: dict[str, float] = {
-        a.name: a.cost_per_turn for a in config.agents
-    }
-
-    for wave in wave_plan.waves:
-        for a in wave.assignments:
-            if a.agent_name in agent_work:
-                agent_work[a.agent_name] += a.duration_minutes
-                agent_tasks[a.agent_name] += 1
-
+    # Agent load
     report_agent_load = tuple(
         ReportAgentLoad(
             agent=name,
-            task_count=agent_tasks[name],
-            total_work_minutes=agent_work[name],
-            estimated_cost=agent_work[name] / _MINUTES_PER_TURN * cost_per_turn[name],
+            task_count=agent_tasks[agent],
+            total_work_minutes=agent_work[agent],
+            estimated_cost=agent_work[agent] / _MINUTES_PER_TURN * agent_index.costs[agent],
         )
-        for name in agent_work
+        for name, agent in by_name.items()
     )
 
     # Critical path — map task_ids to names
-    critical_path = tuple(
-        names[int(tid)] for tid in wave_plan.critical_path
-    )
+    critical_path = tuple(names[tid] for tid in wave_plan.critical_path)
 
     return EstimationReport(
         tasks=report_tasks,
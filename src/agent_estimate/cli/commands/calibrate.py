@@ -7,6 +7,7 @@ from pathlib import Path
 import typer
 
 from agent_estimate.adapters.sqlite_store import SQLiteCalibrationStore
+from agent_estimate.cli.commands._util import exit_with_error
 
 
 def run(
@@ -18,35 +19,31 @@ def run(
 ) -> None:
     """Update model calibration from historical outcomes."""
     if not db.exists():
-        typer.echo("Error: No calibration database found.", err=True)
-        typer.echo(f"Expected: {db}", err=True)
-        raise typer.Exit(code=1)
+        exit_with_error(f"No calibration database found.\nExpected: {db}", 1)
 
     try:
         with SQLiteCalibrationStore(db) as store:
             store.calibrate()
             rows = store.query_calibration_summary()
     except Exception as exc:
-        typer.echo(f"Error: {exc}", err=True)
-        raise typer.Exit(code=1)
+        exit_with_error(str(exc), 1)
 
     if not rows:
         typer.echo("No calibration data available.")
         return
 
-    # Print summary table
+    # Print summary table; stringify every cell once and size columns in one pass
     headers = list(rows[0].keys())
-    col_widths = {
-        h: max(len(h), max(len(str(r.get(h, ""))) for r in rows))
-        for h in headers
-    }
-
-    header_line = " | ".join(h.ljust(col_widths[h]) for h in headers)
-    separator = "-+-".join("-" * col_widths[h] for h in headers)
-    typer.echo(header_line)
-    typer.echo(separator)
-    for row in rows:
-        line = " | ".join(
-            str(row.get(h, "")).ljust(col_widths[h]) for h in headers
-        )
-        typer.echo(line)
+    cells = [[str(row.get(h, "")) for h in headers] for row in rows]
+    widths = [len(h) for h in headers]
+    for row_cells in cells:
+        for index, cell in enumerate(row_cells):
+            widths[index] = max(widths[index], len(cell))
+
+    lines = [
+        " | ".join(h.ljust(width) for h, width in zip(headers, widths)),
+        "-+-".join("-" * width for width in widths),
+    ]
+    for row_cells in cells:
+        lines.append(" | ".join(cell.ljust(width) for cell, width in zip(row_cells, widths)))
+    typer.echo("\n".join(lines))
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import NoReturn, Optional
+from typing import Any, Optional, TypeVar
 
 import typer
 
@@ -12,13 +15,16 @@ from agent_estimate.adapters.config_loader import load_config, load_default_conf
 from agent_estimate.adapters.github_adapter import GitHubAdapterError
 from agent_estimate.adapters.github_ghcli import GitHubGhCliAdapter
 from agent_estimate.cli.commands._pipeline import run_estimate_pipeline
+from agent_estimate.cli.commands._util import exit_with_error
 from agent_estimate.cli.commands.github import parse_issue_selection
-from agent_estimate.core import EstimationCategory, ReviewMode
+from agent_estimate.core import EstimationCategory, EstimationConfig, ReviewMode
 from agent_estimate.core.history import infer_warm_context
 from agent_estimate.render import render_json_report, render_markdown_report
 
 logger = logging.getLogger("agent_estimate")
 
+_T = TypeVar("_T")
+
 
 def run(
     task: Optional[str] = typer.Argument(None, help="Task description to estimate."),
@@ -109,11 +115,11 @@ def run(
 ) -> None:
     """Estimate effort for one or more task descriptions."""
     # --- Resolve input source (exactly one) ---
-    sources = sum([task is not None, file is not None, issues is not None])
+    sources = (task is not None) + (file is not None) + (issues is not None)
     if sources == 0:
-        _error("Provide a task description, --file, or --issues.", 2)
+        exit_with_error("Provide a task description, --file, or --issues.", 2)
     if sources > 1:
-        _error("Provide only one input source: task argument, --file, or --issues.", 2)
+        exit_with_error("Provide only one input source: task argument, --file, or --issues.", 2)
 
     descriptions: list[str] = []
 
@@ -121,55 +127,86 @@ def run(
         descriptions = [task]
     elif file is not None:
         try:
-            lines = file.read_text(encoding="utf-8").splitlines()
-            descriptions = [ln.strip() for ln in lines if ln.strip()]
+            with file.open(encoding="utf-8") as handle:
+                # Re-split each line so form feeds, U+2028 etc. still separate tasks.
+                descriptions = [
+                    stripped
+                    for raw in handle
+                    for line in raw.splitlines()
+                    if (stripped := line.strip())
+                ]
         except FileNotFoundError:
-            _error(f"File not found: {file}", 2)
+            exit_with_error(f"File not found: {file}", 2)
         if not descriptions:
-            _error(f"No task descriptions found in {file}.", 2)
+            exit_with_error(f"No task descriptions found in {file}.", 2)
     elif issues is not None:
         if not repo:
-            _error("--repo is required when using --issues.", 2)
+            exit_with_error("--repo is required when using --issues.", 2)
         try:
             issue_numbers = parse_issue_selection(issues)
         except ValueError:
-            _error(f"Invalid issue numbers: {issues}", 2)
+            exit_with_error(f"Invalid issue numbers: {issues}", 2)
         if not issue_numbers:
-            _error("No issue numbers provided.", 2)
+            exit_with_error("No issue numbers provided.", 2)
+
+    # --- Start config and history loads ---
+    # Both are local file parses. When descriptions come from GitHub, run them
+    # on a worker thread so they overlap the network round trip; errors are
+    # surfaced below, in the same order as before.
+    prefetch = ThreadPoolExecutor(max_workers=1) if issues is not None else None
+    history_path = history_file
+    history_stat: os.stat_result | None = None
+    if history_path is None:
+        # One stat() both detects the default file and keys the history cache.
+        default_history = Path("data.json")
+        try:
+            history_stat = default_history.stat()
+        except OSError:
+            pass
+        else:
+            history_path = default_history
+    cfg_future = _submit(prefetch, _load_estimation_config, config)
+    warm_ctx_future = _submit(
+        prefetch,
+        infer_warm_context,
+        history_path,
+        agent=history_agent,
+        project=history_project,
+        history_stat=history_stat,
+        # The detail is only reported when the inferred value is applied.
+        build_detail=warm_context == 1.0,
+    )
+    if prefetch is not None:
+        # No more work is queued; the worker exits once both loads finish.
+        prefetch.shutdown(wait=False)
+
+    if issues is not None:
         try:
             adapter = GitHubGhCliAdapter()
             descriptions = adapter.fetch_task_descriptions_by_numbers(
                 repo, issue_numbers
             )
         except GitHubAdapterError as exc:
-            _error(f"GitHub error: {exc}", 1)
+            exit_with_error(f"GitHub error: {exc}", 1)
 
     # --- Resolve review mode ---
     try:
         mode = ReviewMode(review_mode)
     except ValueError:
-        _error(
+        exit_with_error(
             f"Invalid review mode: {review_mode!r}. Use none, standard, or complex.", 2
         )
 
     # --- Load config ---
     try:
-        cfg = load_config(config) if config else load_default_config()
+        cfg = cfg_future.result()
     except FileNotFoundError:
-        _error(f"Config file not found: {config}", 2)
+        exit_with_error(f"Config file not found: {config}", 2)
     except ValueError as exc:
-        _error(f"Config validation error: {exc}", 2)
+        exit_with_error(f"Config validation error: {exc}", 2)
 
     # --- Infer warm context from dispatch history ---
-    history_path = history_file
-    if history_path is None:
-        default_history = Path("data.json")
-        if default_history.exists():
-            history_path = default_history
-
-    warm_ctx = infer_warm_context(
-        history_path, agent=history_agent, project=history_project
-    )
+    warm_ctx = warm_ctx_future.result()
     # Auto-inferred warm_context applies when --warm-context wasn't explicitly set
     effective_warm_context = warm_context
     effective_detail: str | None = None
@@ -187,7 +224,7 @@ def run(
             estimation_category = EstimationCategory(task_type.lower())
         except ValueError:
             valid = ", ".join(c.value for c in EstimationCategory)
-            _error(f"Invalid task type: {task_type!r}. Use one of: {valid}.", 2)
+            exit_with_error(f"Invalid task type: {task_type!r}. Use one of: {valid}.", 2)
 
     # --- Run pipeline ---
     try:
@@ -207,9 +244,9 @@ def run(
             task_category=estimation_category,
         )
     except ValueError as exc:
-        _error(f"Estimation error: {exc}", 2)
+        exit_with_error(f"Estimation error: {exc}", 2)
     except RuntimeError as exc:
-        _error(f"Runtime error: {exc}", 1)
+        exit_with_error(f"Runtime error: {exc}", 1)
 
     # --- Output ---
     if format == "markdown":
@@ -217,10 +254,25 @@ def run(
     elif format == "json":
         typer.echo(render_json_report(report), nl=False)
     else:
-        _error(f"Unknown format: {format!r}. Use markdown or json.", 2)
+        exit_with_error(f"Unknown format: {format!r}. Use markdown or json.", 2)
+
 
+def _load_estimation_config(config: Path | None) -> EstimationConfig:
+    return load_config(config) if config else load_default_config()
 
-def _error(message: str, exit_code: int) -> NoReturn:
-    """Print error to stderr and exit."""
-    typer.echo(f"Error: {message}", err=True)
-    raise typer.Exit(code=exit_code)
+
+def _submit(
+    executor: ThreadPoolExecutor | None,
+    fn: Callable[..., _T],
+    *args: Any,
+    **kwargs: Any,
+) -> Future[_T]:
+    """Run *fn* on *executor*, or inline when there is nothing to overlap with."""
+    if executor is not None:
+        return executor.submit(fn, *args, **kwargs)
+    future: Future[_T] = Future()
+    try:
+        future.set_result(fn(*args, **kwargs))
+    except Exception as exc:  # noqa: BLE001 - mirror executor.submit
+        future.set_exception(exc)
+    return future
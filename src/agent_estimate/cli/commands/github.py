@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-import re
-
-_ISSUE_TOKEN_RE = re.compile(r"^\d+$")
-
 
 def parse_issue_selection(value: str) -> list[int]:
     """Parse issue selection text into integer issue numbers.
@@ -13,17 +9,15 @@ def parse_issue_selection(value: str) -> list[int]:
     Accepts comma or whitespace separators, with optional leading '#'.
     Examples: "1,2,3", "#1 #2 #3", "1, #2 3".
     """
-    if not value.strip():
-        return []
+    if value.isdecimal():
+        # Common single-issue case, e.g. "1234"
+        return [int(value)]
 
     numbers: list[int] = []
-    for raw_token in re.split(r"[,\s]+", value.strip()):
-        token = raw_token.strip()
-        if not token:
-            continue
-        if token.startswith("#"):
-            token = token[1:]
-        if not _ISSUE_TOKEN_RE.fullmatch(token):
+    for raw_token in value.replace(",", " ").split():
+        token = raw_token[1:] if raw_token.startswith("#") else raw_token
+        # isdecimal() accepts exactly the characters the old \d+ pattern did.
+        if not token.isdecimal():
             raise ValueError(f"Invalid issue token: {raw_token}")
         numbers.append(int(token))
     return numbers
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from typing import NoReturn, Optional
+import json
+from typing import Optional
 
 import typer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from agent_estimate.cli.commands._util import exit_with_error
 from agent_estimate.core.session import (
     DEFAULT_COORDINATION_OVERHEAD_MINUTES,
     SESSION_TYPE_DURATIONS,
@@ -74,11 +81,9 @@ def run(
             per_round_minutes=per_round_minutes,
         )
     except ValueError as exc:
-        _error(str(exc), 2)
+        exit_with_error(str(exc), 2)
 
     if format == "json":
-        import json
-
         data = {
             "agents": result.agents,
             "rounds": result.rounds,
@@ -89,11 +94,15 @@ def run(
             "agent_minutes": result.agent_minutes,
             "rounds_breakdown": list(result.rounds_breakdown),
         }
-        typer.echo(json.dumps(data, indent=2), nl=False)
+        if orjson is not None:
+            rendered = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            rendered = json.dumps(data, indent=2)
+        typer.echo(rendered, nl=False)
     elif format == "markdown":
         _render_markdown(result)
     else:
-        _error(f"Unknown format: {format!r}. Use markdown or json.", 2)
+        exit_with_error(f"Unknown format: {format!r}. Use markdown or json.", 2)
 
 
 # ---------------------------------------------------------------------------
@@ -110,29 +119,25 @@ def _render_markdown(result: SessionEstimate) -> None:
     wall_str = f"{wall_h}h {wall_m}m" if wall_h else f"{wall_m}m"
     agent_str = f"{agent_h}h {agent_m}m" if agent_h else f"{agent_m}m"
 
-    typer.echo("## Session Estimate\n")
-    typer.echo("| Field                    | Value                      |")
-    typer.echo("|--------------------------|----------------------------|")
-    typer.echo(f"| Agents                   | {result.agents:<26} |")
-    typer.echo(f"| Rounds                   | {result.rounds:<26} |")
-    typer.echo(f"| Task type                | {result.task_type:<26} |")
-    typer.echo(
-        f"| Per-agent per-round      | {result.per_agent_round_minutes:.0f}m{'':<23} |"
-    )
-    typer.echo(
-        f"| Coordination overhead    | {result.coordination_overhead_minutes:.0f}m / round{'':<15} |"
-    )
-    typer.echo(f"| **Wall-clock**           | **{wall_str}**{'':<{22 - len(wall_str)}} |")
-    typer.echo(f"| **Agent-minutes**        | **{agent_str}**{'':<{22 - len(agent_str)}} |")
+    lines = [
+        "## Session Estimate\n",
+        "| Field                    | Value                      |",
+        "|--------------------------|----------------------------|",
+        f"| Agents                   | {result.agents:<26} |",
+        f"| Rounds                   | {result.rounds:<26} |",
+        f"| Task type                | {result.task_type:<26} |",
+        f"| Per-agent per-round      | {result.per_agent_round_minutes:.0f}m{'':<23} |",
+        f"| Coordination overhead    | {result.coordination_overhead_minutes:.0f}m / round{'':<15} |",
+        f"| **Wall-clock**           | **{wall_str}**{'':<{22 - len(wall_str)}} |",
+        f"| **Agent-minutes**        | **{agent_str}**{'':<{22 - len(agent_str)}} |",
+    ]
 
     if len(result.rounds_breakdown) > 1:
-        typer.echo("\n### Round breakdown\n")
+        lines.append("\n### Round breakdown\n")
         for i, rd in enumerate(result.rounds_breakdown, 1):
             h, m = divmod(round(rd + result.coordination_overhead_minutes), 60)
             rstr = f"{h}h {m}m" if h else f"{m}m"
-            typer.echo(f"- Round {i}: {rstr} wall-clock")
+            lines.append(f"- Round {i}: {rstr} wall-clock")
 
+    typer.echo("\n".join(lines))
 
-def _error(message: str, exit_code: int) -> NoReturn:
-    typer.echo(f"Error: {message}", err=True)
-    raise typer.Exit(code=exit_code)
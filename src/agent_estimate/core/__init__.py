@@ -30,6 +30,7 @@ from agent_estimate.core.pert import (
     check_metr_threshold,
     compute_pert,
     estimate_task,
+    estimate_task_with_human_equivalent,
     load_metr_thresholds,
 )
 from agent_estimate.core.sizing import TierCorrection, auto_correct_tier, classify_task
@@ -76,6 +77,7 @@ __all__ = [
     "estimate_documentation",
     "estimate_research",
     "estimate_task",
+    "estimate_task_with_human_equivalent",
     "get_human_multiplier",
     "infer_warm_context",
     "load_metr_thresholds",
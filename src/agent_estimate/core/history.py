@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("agent_estimate")
 
+# Upper bounds (exclusive, in hours) of the warm_context decay bands and the
+# value for each band; the last value applies at or beyond the final bound.
+_DECAY_BOUNDS_HOURS: tuple[float, ...] = (2.0, 12.0, 24.0)
+_DECAY_VALUES: tuple[float, ...] = (0.3, 0.5, 0.7, 1.0)
+
 
 @dataclass(frozen=True)
 class WarmContextResult:
@@ -26,6 +40,8 @@ def infer_warm_context(
     agent: str | None = None,
     project: str | None = None,
     reference_time: datetime | None = None,
+    history_stat: os.stat_result | None = None,
+    build_detail: bool = True,
 ) -> WarmContextResult:
     """Infer warm_context from dispatch history.
 
@@ -34,6 +50,10 @@ def infer_warm_context(
         agent: Filter dispatches by agent name.
         project: Filter dispatches by project name.
         reference_time: Reference time for recency calculation (default: now).
+        history_stat: ``stat()`` result the caller already holds for
+            *history_path*; skips a second stat when provided.
+        build_detail: Format the human-readable ``detail`` string. Callers that
+            only read ``value`` can pass False to skip it; ``detail`` is then None.
 
     Returns:
         WarmContextResult with the inferred value and metadata.
@@ -41,30 +61,91 @@ def infer_warm_context(
     if history_path is None:
         return WarmContextResult(value=1.0, source="default")
 
-    dispatches = _load_dispatches(history_path)
-    if not dispatches:
+    recent = _most_recent_dispatch(history_path, agent, project, history_stat)
+    if recent is None:
         return WarmContextResult(value=1.0, source="default")
 
     if reference_time is None:
         reference_time = datetime.now(timezone.utc)
 
-    # Filter by agent and project if specified
-    filtered = dispatches
-    if agent is not None:
-        filtered = [d for d in filtered if d.get("agent") == agent]
-    if project is not None:
-        filtered = [d for d in filtered if d.get("project") == project]
+    hours_ago = (reference_time - recent.completed_at).total_seconds() / 3600.0
+
+    value = _decay_to_warm_context(hours_ago)
+    if not build_detail:
+        return WarmContextResult(value=value, source="auto")
+
+    # Build detail string
+    if hours_ago < 1:
+        time_str = f"{int(hours_ago * 60)}m ago"
+    else:
+        time_str = f"{hours_ago:.0f}h ago"
+    detail = f"{recent.agent} active {time_str} on {recent.project}"
+
+    return WarmContextResult(value=value, source="auto", detail=detail)
+
+
+@dataclass(frozen=True)
+class _RecentDispatch:
+    """The most recent completed dispatch matching an agent/project filter."""
+
+    agent: str
+    project: str
+    completed_at: datetime
+
+
+def _most_recent_dispatch(
+    path: Path,
+    agent: str | None,
+    project: str | None,
+    stat: os.stat_result | None = None,
+) -> _RecentDispatch | None:
+    """Return the latest matching dispatch, reusing the scan while the file is unchanged.
+
+    The lookup is cached per (path, agent, project, mtime, size), and the parsed
+    dispatches per (path, mtime, size), so repeated inference against an
+    unmodified history file skips the read and JSON parse even when the
+    agent/project filter changes. Only the file-derived part is cached;
+    recency is computed by the caller against its own reference time.
+    """
+    if stat is None:
+        try:
+            stat = path.stat()
+        except OSError:
+            # Let the loader report the missing/unreadable file.
+            return _scan_most_recent(_load_dispatches(path), agent, project)
+    return _cached_most_recent(str(path.resolve()), agent, project, stat.st_mtime_ns, stat.st_size)
 
-    if not filtered:
-        return WarmContextResult(value=1.0, source="default")
 
-    # Find the most recent dispatch by completed_at
+@functools.lru_cache(maxsize=32)
+def _cached_most_recent(
+    path_str: str,
+    agent: str | None,
+    project: str | None,
+    mtime_ns: int,
+    size: int,
+) -> _RecentDispatch | None:
+    return _scan_most_recent(_cached_dispatches(path_str, mtime_ns, size), agent, project)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_dispatches(path_str: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    return tuple(_load_dispatches(Path(path_str)))
+
+
+def _scan_most_recent(
+    dispatches: Sequence[dict], agent: str | None, project: str | None
+) -> _RecentDispatch | None:
+    # Filter by agent/project and find the most recent completed_at in one pass
     most_recent = None
     most_recent_time: datetime | None = None
-    for d in filtered:
+    for d in dispatches:
         completed_at = d.get("completed_at")
         if completed_at is None:
             continue
+        if agent is not None and d.get("agent") != agent:
+            continue
+        if project is not None and d.get("project") != project:
+            continue
         try:
             dt = datetime.fromisoformat(completed_at)
             if dt.tzinfo is None:
@@ -76,22 +157,12 @@ def infer_warm_context(
             most_recent = d
 
     if most_recent is None or most_recent_time is None:
-        return WarmContextResult(value=1.0, source="default")
-
-    hours_ago = (reference_time - most_recent_time).total_seconds() / 3600.0
-
-    value = _decay_to_warm_context(hours_ago)
-
-    # Build detail string
-    agent_name = most_recent.get("agent", "unknown")
-    project_name = most_recent.get("project", "unknown")
-    if hours_ago < 1:
-        time_str = f"{int(hours_ago * 60)}m ago"
-    else:
-        time_str = f"{hours_ago:.0f}h ago"
-    detail = f"{agent_name} active {time_str} on {project_name}"
-
-    return WarmContextResult(value=value, source="auto", detail=detail)
+        return None
+    return _RecentDispatch(
+        agent=most_recent.get("agent", "unknown"),
+        project=most_recent.get("project", "unknown"),
+        completed_at=most_recent_time,
+    )
 
 
 def _decay_to_warm_context(hours_ago: float) -> float:
@@ -103,13 +174,7 @@ def _decay_to_warm_context(hours_ago: float) -> float:
         12-24h -> 0.7 (lukewarm)
         >=24h -> 1.0 (cold)
     """
-    if hours_ago < 2:
-        return 0.3
-    if hours_ago < 12:
-        return 0.5
-    if hours_ago < 24:
-        return 0.7
-    return 1.0
+    return _DECAY_VALUES[bisect_right(_DECAY_BOUNDS_HOURS, hours_ago)]
 
 
 def _load_dispatches(path: Path) -> list[dict]:
@@ -120,7 +185,7 @@ def _load_dispatches(path: Path) -> list[dict]:
     Returns an empty list on missing file, malformed JSON, or missing key.
     """
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except FileNotFoundError:
         logger.warning("History file not found: %s", path)
         return []
@@ -129,8 +194,8 @@ def _load_dispatches(path: Path) -> list[dict]:
         return []
 
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as exc:  # JSONDecodeError, or bytes that are not valid UTF-8
         logger.warning("Malformed JSON in history file %s: %s", path, exc)
         return []
 
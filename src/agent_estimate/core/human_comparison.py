@@ -18,6 +18,11 @@ _HUMAN_MULTIPLIERS: dict[TaskType, tuple[float, float]] = {
     TaskType.UNKNOWN: (2.0, 4.0),
 }
 
+# Geometric means folded once at import; lookups are on the per-task path.
+_HUMAN_MULTIPLIER_GM: dict[TaskType, float] = {
+    task_type: math.sqrt(lo * hi) for task_type, (lo, hi) in _HUMAN_MULTIPLIERS.items()
+}
+
 
 def get_human_multiplier(task_type: TaskType) -> float:
     """Return the geometric-mean human multiplier for a task type.
@@ -25,8 +30,7 @@ def get_human_multiplier(task_type: TaskType) -> float:
     The multiplier represents how many times longer a human would take
     compared to an AI agent for this category of work.
     """
-    lo, hi = _HUMAN_MULTIPLIERS[task_type]
-    return math.sqrt(lo * hi)
+    return _HUMAN_MULTIPLIER_GM[task_type]
 
 
 def compute_human_equivalent(agent_minutes: float, task_type: TaskType) -> float:
@@ -39,4 +43,4 @@ def compute_human_equivalent(agent_minutes: float, task_type: TaskType) -> float
     Returns:
         Estimated human time in minutes.
     """
-    return agent_minutes * get_human_multiplier(task_type)
+    return agent_minutes * _HUMAN_MULTIPLIER_GM[task_type]
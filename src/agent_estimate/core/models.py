@@ -6,11 +6,13 @@ import enum
 from collections.abc import Mapping, Sequence
 import dataclasses
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Annotated, Protocol, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+TaskId = str | int
 
 
 # ---------------------------------------------------------------------------
@@ -121,16 +123,20 @@ class EstimationCategory(enum.Enum):
     @classmethod
     def _missing_(cls, value: object) -> "EstimationCategory | None":
         """Accept common aliases for category names."""
-        _aliases: dict[str, "EstimationCategory"] = {
-            "sre": cls.CONFIG_SRE,
-            "config_sre": cls.CONFIG_SRE,
-            "docs": cls.DOCUMENTATION,
-        }
         if isinstance(value, str):
-            return _aliases.get(value.lower())
+            return _ESTIMATION_CATEGORY_ALIASES.get(value.lower())
         return None
 
 
+_ESTIMATION_CATEGORY_ALIASES: Mapping[str, EstimationCategory] = MappingProxyType(
+    {
+        "sre": EstimationCategory.CONFIG_SRE,
+        "config_sre": EstimationCategory.CONFIG_SRE,
+        "docs": EstimationCategory.DOCUMENTATION,
+    }
+)
+
+
 class ReviewMode(enum.Enum):
     """Code-review overhead model (additive minutes).
 
@@ -150,21 +156,25 @@ class ReviewMode(enum.Enum):
     @classmethod
     def _missing_(cls, value: object) -> "ReviewMode | None":
         """Accept legacy CLI values."""
-        _legacy: dict[str, "ReviewMode"] = {
-            "self": cls.NONE,
-            "2x-lgtm": cls.STANDARD,
-        }
         if isinstance(value, str):
-            return _legacy.get(value)
+            return _LEGACY_REVIEW_MODES.get(value)
         return None
 
 
+_LEGACY_REVIEW_MODES: Mapping[str, ReviewMode] = MappingProxyType(
+    {
+        "self": ReviewMode.NONE,
+        "2x-lgtm": ReviewMode.STANDARD,
+    }
+)
+
+
 # ---------------------------------------------------------------------------
 # Result dataclasses (frozen, output-only)
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PertResult:
     """Raw PERT computation output."""
 
@@ -175,7 +185,7 @@ class PertResult:
     sigma: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SizingResult:
     """Tier assignment with calibrated baselines (minutes)."""
 
@@ -187,7 +197,7 @@ class SizingResult:
     signals: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModifierSet:
     """Collected modifiers applied to a baseline estimate."""
 
@@ -199,7 +209,7 @@ class ModifierSet:
     clamped: bool  # True when floor was applied
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetrWarning:
     """Warning emitted when an estimate exceeds METR p80 threshold."""
 
@@ -209,7 +219,7 @@ class MetrWarning:
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskEstimate:
     """Full estimation result for one task."""
 
@@ -228,7 +238,7 @@ class TaskEstimate:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskNode:
     """Input: one task to be scheduled.
 
@@ -236,24 +246,26 @@ class TaskNode:
     ``review_minutes`` is the per-task review overhead; the wave planner
     amortizes this across same-agent tasks in each wave so only a single
     review cycle is charged per agent per wave.
+    ``task_id`` may be any string or int; the pipeline uses each task's
+    index so report code can index straight into its task lists.
     """
 
-    task_id: str
+    task_id: TaskId
     duration_minutes: float
-    dependencies: tuple[str, ...] = ()
+    dependencies: tuple[TaskId, ...] = ()
     required_capabilities: tuple[str, ...] = ()
     review_minutes: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaveAssignment:
     """One task assigned to an agent slot within a wave."""
 
-    task_id: str
+    task_id: TaskId
     agent_name: str
     slot_index: int
     duration_minutes: float
-    co_dispatch_group: tuple[str, ...] = ()
+    co_dispatch_group: tuple[TaskId, ...] = ()
     """Task IDs co-dispatched to the same agent in the same wave.
 
     Non-empty only when two or more tasks are assigned to the same agent within
@@ -263,7 +275,7 @@ class WaveAssignment:
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Wave:
     """A single scheduling wave.
 
@@ -279,12 +291,12 @@ class Wave:
     agent_review_minutes: Mapping[str, float] = dataclasses.field(default_factory=dict)  # type: ignore[assignment]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WavePlan:
     """Complete wave plan output."""
 
     waves: tuple[Wave, ...]
-    critical_path: tuple[str, ...]
+    critical_path: tuple[TaskId, ...]
     critical_path_minutes: float
     agent_utilization: Mapping[str, float]
     parallel_efficiency: float
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from agent_estimate.core.models import ModifierSet, ReviewMode
@@ -41,21 +42,25 @@ def build_modifier_set(
     _validate_range("warm_context", warm_context, 0.3, 1.15)
     _validate_range("agent_fit", agent_fit, 0.9, 1.2)
 
-    raw_combined = spec_clarity * warm_context * agent_fit
-    clamped = raw_combined < _MODIFIER_FLOOR
-    combined = raw_combined
-    if clamped:
-        combined = _MODIFIER_FLOOR
+    modifier_set = _modifier_set(spec_clarity, warm_context, agent_fit)
+    if modifier_set.clamped:
         logger.warning(
             "Modifier product %.4f clamped to %.2f (prevents sub-10m pathology)",
-            raw_combined,
+            modifier_set.raw_combined,
             _MODIFIER_FLOOR,
         )
+    return modifier_set
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _modifier_set(spec_clarity: float, warm_context: float, agent_fit: float) -> ModifierSet:
+    raw_combined = spec_clarity * warm_context * agent_fit
+    clamped = raw_combined < _MODIFIER_FLOOR
     return ModifierSet(
         spec_clarity=spec_clarity,
         warm_context=warm_context,
         agent_fit=agent_fit,
-        combined=combined,
+        combined=_MODIFIER_FLOOR if clamped else raw_combined,
         raw_combined=raw_combined,
         clamped=clamped,
     )
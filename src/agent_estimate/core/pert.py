@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from importlib.resources import as_file, files
+from types import MappingProxyType
 from typing import Mapping
 
 import yaml
 
+from agent_estimate.core.human_comparison import compute_human_equivalent
 from agent_estimate.core.models import (
+    EstimationCategory,
     MetrWarning,
     ModifierSet,
     PertResult,
@@ -19,6 +23,11 @@ from agent_estimate.core.models import (
 )
 from agent_estimate.core.modifiers import apply_modifiers, compute_review_overhead
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 METR_THRESHOLDS_FILENAME = "metr_thresholds.yaml"
 logger = logging.getLogger("agent_estimate")
 
@@ -51,6 +60,7 @@ def _normalize_model_token(value: str) -> str:
     return normalized.strip("_")
 
 
+@functools.lru_cache(maxsize=256)
 def _resolve_threshold_model_key(model_key: str, *, agent_name: str | None = None) -> str:
     normalized_model = _normalize_model_token(model_key)
     if normalized_model in _MODEL_KEY_ALIASES:
@@ -91,16 +101,21 @@ def compute_pert(optimistic: float, most_likely: float, pessimistic: float) -> P
 def load_metr_thresholds() -> dict[str, float]:
     """Load METR p80 thresholds from the packaged YAML file.
 
-    Returns a dict mapping model_key -> p80_minutes.
+    Returns a dict mapping model_key -> p80_minutes. The file is parsed once
+    per process; each call returns a fresh copy the caller may mutate.
     """
+    return dict(_metr_thresholds())
+
+
+@functools.lru_cache(maxsize=1)
+def _metr_thresholds() -> Mapping[str, float]:
     resource = files("agent_estimate").joinpath(METR_THRESHOLDS_FILENAME)
     with as_file(resource) as path:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
     try:
-        return {
-            key: float(entry["p80_minutes"])
-            for key, entry in raw.get("models", {}).items()
-        }
+        return MappingProxyType(
+            {key: float(entry["p80_minutes"]) for key, entry in raw.get("models", {}).items()}
+        )
     except (KeyError, TypeError, ValueError) as exc:
         raise RuntimeError(f"Malformed {METR_THRESHOLDS_FILENAME}: {exc}") from exc
 
@@ -126,7 +141,7 @@ def check_metr_threshold(
         A MetrWarning if the estimate exceeds the threshold, else None.
     """
     if thresholds is None:
-        thresholds = load_metr_thresholds()
+        thresholds = _metr_thresholds()
 
     resolved_model_key = _resolve_threshold_model_key(model_key, agent_name=agent_name)
     threshold = thresholds.get(resolved_model_key)
@@ -165,6 +180,7 @@ def estimate_task(
     fallback_threshold: float = 40.0,
     agent_name: str | None = None,
     human_equivalent_minutes: float | None = None,
+    estimation_category: EstimationCategory | None = None,
 ) -> TaskEstimate:
     """Full estimation pipeline: sizing -> PERT -> modifiers -> review -> METR check.
 
@@ -177,10 +193,67 @@ def estimate_task(
         fallback_threshold: METR fallback when model_key is unknown.
         agent_name: Optional assigned agent name for resolving legacy model tiers.
         human_equivalent_minutes: Pre-computed human equivalent (optional).
+        estimation_category: Category to record on the estimate (optional).
 
     Returns:
         A complete TaskEstimate.
     """
+    return _estimate_task_impl(
+        sizing,
+        modifiers,
+        review_mode=review_mode,
+        model_key=model_key,
+        thresholds=thresholds,
+        fallback_threshold=fallback_threshold,
+        agent_name=agent_name,
+        human_equivalent_minutes=human_equivalent_minutes,
+        estimation_category=estimation_category,
+    )
+
+
+def estimate_task_with_human_equivalent(
+    sizing: SizingResult,
+    modifiers: ModifierSet,
+    *,
+    review_mode: ReviewMode = ReviewMode.NONE,
+    model_key: str = "opus",
+    thresholds: Mapping[str, float] | None = None,
+    fallback_threshold: float = 40.0,
+    agent_name: str | None = None,
+    estimation_category: EstimationCategory | None = None,
+) -> TaskEstimate:
+    """Like :func:`estimate_task`, with the human equivalent derived in the same pass.
+
+    ``human_equivalent_minutes`` is computed from the total expected minutes and
+    ``sizing.task_type``, so callers need not estimate twice to fill it in.
+    """
+    return _estimate_task_impl(
+        sizing,
+        modifiers,
+        review_mode=review_mode,
+        model_key=model_key,
+        thresholds=thresholds,
+        fallback_threshold=fallback_threshold,
+        agent_name=agent_name,
+        human_equivalent_minutes=None,
+        estimation_category=estimation_category,
+        derive_human_equivalent=True,
+    )
+
+
+def _estimate_task_impl(
+    sizing: SizingResult,
+    modifiers: ModifierSet,
+    *,
+    review_mode: ReviewMode,
+    model_key: str,
+    thresholds: Mapping[str, float] | None,
+    fallback_threshold: float,
+    agent_name: str | None,
+    human_equivalent_minutes: float | None,
+    estimation_category: EstimationCategory | None,
+    derive_human_equivalent: bool = False,
+) -> TaskEstimate:
     # All three baselines are scaled by the same combined modifier,
     # preserving the O/P ratio intentionally. Modifier uncertainty is
     # captured by the modifier ranges themselves, not PERT spread.
@@ -192,6 +265,8 @@ def estimate_task(
 
     review_minutes = compute_review_overhead(review_mode)
     total = pert.expected + review_minutes
+    if derive_human_equivalent:
+        human_equivalent_minutes = compute_human_equivalent(total, sizing.task_type)
 
     metr_warning = check_metr_threshold(
         model_key,
@@ -209,4 +284,5 @@ def estimate_task(
         total_expected_minutes=total,
         human_equivalent_minutes=human_equivalent_minutes,
         metr_warning=metr_warning,
+        estimation_category=estimation_category,
     )
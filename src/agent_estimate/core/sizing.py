@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -142,7 +143,7 @@ def auto_correct_tier(
         )
         current_tier = SizeTier.XS
 
-    if current_tier == sizing.tier:
+    if current_tier is sizing.tier:
         return TierCorrection(sizing=sizing, warnings=tuple(warnings))
 
     o, m, p = TIER_BASELINES[current_tier]
@@ -157,11 +158,13 @@ def auto_correct_tier(
     return TierCorrection(sizing=corrected, warnings=tuple(warnings))
 
 
+@functools.lru_cache(maxsize=1024)
 def classify_task(description: str) -> SizingResult:
     """Classify a task description into a size tier with calibrated baselines.
 
     Scans for signal words to determine a base tier, then applies complexity
-    bumps. Returns a SizingResult with the final tier and baselines.
+    bumps. Returns a SizingResult with the final tier and baselines. Results
+    are memoized per description; SizingResult is frozen, so callers share them.
     """
     if not description or not description.strip():
         o, m, p = TIER_BASELINES[SizeTier.M]
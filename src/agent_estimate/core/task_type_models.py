@@ -9,6 +9,7 @@ Each category provides a flat or range-based estimate rather than PERT tiers.
 
 from __future__ import annotations
 
+import functools
 import re
 
 from agent_estimate.core.models import (
@@ -95,6 +96,7 @@ _RESEARCH_DEEP_PATTERNS = re.compile(
 )
 
 
+@functools.lru_cache(maxsize=1024)
 def detect_estimation_category(text: str) -> EstimationCategory:
     """Infer EstimationCategory from task title / description text.
 
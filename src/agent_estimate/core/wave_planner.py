@@ -5,10 +5,9 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Sequence
 
-import networkx as nx  # type: ignore[import-untyped]
-
 from agent_estimate.core.models import (
     AgentProfile,
+    TaskId,
     TaskNode,
     Wave,
     WaveAssignment,
@@ -52,11 +51,15 @@ def plan_waves(
             total_sequential_minutes=0.0,
         )
 
+    # networkx costs ~90 ms to import; defer it so CLI commands that never plan
+    # waves (and --help) don't pay for it.
+    import networkx as nx  # type: ignore[import-untyped]
+
     # ------------------------------------------------------------------
     # 1. Build DAG
     # ------------------------------------------------------------------
     G = nx.DiGraph()
-    task_map: dict[str, TaskNode] = {}
+    task_map: dict[TaskId, TaskNode] = {}
     for t in tasks:
         task_map[t.task_id] = t
         G.add_node(t.task_id, duration_minutes=t.duration_minutes)
@@ -74,7 +77,9 @@ def plan_waves(
     if not nx.is_directed_acyclic_graph(G):
         cycle = nx.find_cycle(G, orientation="original")
         cycle_path = [u for u, _v, _dir in cycle] + [cycle[0][0]]
-        raise ValueError(f"Dependency cycle detected: {' -> '.join(cycle_path)}")
+        raise ValueError(
+            f"Dependency cycle detected: {' -> '.join(str(t) for t in cycle_path)}"
+        )
 
     # ------------------------------------------------------------------
     # 3. Expand agent slots
@@ -112,7 +117,7 @@ def plan_waves(
         assignments: list[WaveAssignment] = []
 
         # Track which tasks land on each agent in this wave (for co-dispatch detection)
-        agent_wave_tasks: dict[str, list[str]] = defaultdict(list)
+        agent_wave_tasks: dict[str, list[TaskId]] = defaultdict(list)
 
         for tid in sorted_tasks:
             node = task_map[tid]
@@ -153,8 +158,8 @@ def plan_waves(
         # Build a mapping from task_id → co_dispatch_group for agents with
         # multiple tasks.  Then rebuild assignments with adjusted durations
         # and co_dispatch_group populated.
-        co_dispatch_group_map: dict[str, tuple[str, ...]] = {}
-        adjusted_duration_map: dict[str, float] = {}
+        co_dispatch_group_map: dict[TaskId, tuple[TaskId, ...]] = {}
+        adjusted_duration_map: dict[TaskId, float] = {}
         for agent_name, tids in agent_wave_tasks.items():
             if len(tids) < 2:
                 continue
@@ -244,8 +249,8 @@ def plan_waves(
     # nx.dag_longest_path uses edge weights; we need node weights.
     # DP over topological order: dist[v] = duration[v] + max(dist[u] for u in preds).
     topo_order = list(nx.topological_sort(G))
-    dist: dict[str, float] = {}
-    prev: dict[str, str | None] = {}
+    dist: dict[TaskId, float] = {}
+    prev: dict[TaskId, TaskId | None] = {}
     for v in topo_order:
         predecessors = list(G.predecessors(v))
         if not predecessors:
@@ -259,8 +264,8 @@ def plan_waves(
     # Reconstruct path from the node with maximum distance
     end_node = max(topo_order, key=lambda v: dist[v])
     critical_path_minutes = dist[end_node]
-    path: list[str] = []
-    node: str | None = end_node
+    path: list[TaskId] = []
+    node: TaskId | None = end_node
     while node is not None:
         path.append(node)
         node = prev[node]
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from agent_estimate.core.models import EstimationCategory, TaskEstimate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportTask:
     """Flattened per-task report row for renderers."""
 
@@ -66,7 +66,7 @@ class ReportTask:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportWave:
     """One scheduling wave in the report.
 
@@ -82,7 +82,7 @@ class ReportWave:
     agent_review_minutes: Mapping[str, float] = dataclasses.field(default_factory=dict)  # type: ignore[assignment]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportTimeline:
     """Top-level timeline summary metrics."""
 
@@ -99,7 +99,7 @@ class ReportTimeline:
         return self.human_equivalent_minutes / self.expected_case_minutes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportAgentLoad:
     """Agent-level load and cost totals."""
 
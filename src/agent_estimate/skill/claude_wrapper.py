@@ -31,7 +31,7 @@ def run_estimate(
     Returns the completed process so callers can inspect stdout/stderr.
     Raises ``ValueError`` if no input source is provided.
     """
-    sources = sum([task is not None, file is not None, issues is not None])
+    sources = (task is not None) + (file is not None) + (issues is not None)
     if sources == 0:
         raise ValueError("Provide task, file, or issues.")
     if sources > 1:
@@ -7,6 +7,8 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
+from agent_estimate.adapters.github_adapter import GitHubAdapterError
+from agent_estimate.adapters.sqlite_store import ObservationInput, SQLiteCalibrationStore
 from agent_estimate.cli.app import app
 from agent_estimate.cli.commands import estimate as estimate_command
 
@@ -16,6 +18,28 @@ FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
 _ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
 
 
+def _calibration_observation(task_type: str, error_ratio: float) -> ObservationInput:
+    return ObservationInput(
+        task_type=task_type,
+        estimated_secs=120.0,
+        actual_work_secs=140.0,
+        actual_total_secs=150.0,
+        error_ratio=error_ratio,
+        file_count=3,
+        line_count=220,
+        test_count=4,
+        project_hash="proj-123",
+        spec_clarity_modifier=0.8,
+        warm_context_modifier=0.6,
+        execution_mode="sync",
+        review_mode="async",
+        review_overhead_secs=30.0,
+        verdict="pass",
+        modifiers_should_have_been={},
+        observed_at="2026-02-16T12:00:00+00:00",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Version
 # ---------------------------------------------------------------------------
@@ -212,6 +236,18 @@ class TestEstimateFileInput:
         assert result.exit_code != 0
         assert "File not found" in result.output
 
+    def test_estimate_file_splits_on_all_line_boundaries(self, tmp_path: Path) -> None:
+        import json
+
+        task_file = tmp_path / "tasks.txt"
+        task_file.write_text(
+            "Add a button\x0cFix the login bug\u2028Write docs\r\nAdd tests\n",
+            encoding="utf-8",
+        )
+        result = runner.invoke(app, ["estimate", "--format", "json", "--file", str(task_file)])
+        assert result.exit_code == 0
+        assert len(json.loads(result.output)["tasks"]) == 4
+
 
 # ---------------------------------------------------------------------------
 # Estimate — review modes
@@ -310,6 +346,41 @@ class TestEstimateErrors:
         result = runner.invoke(app, ["estimate", "--config", config, "task"])
         assert result.exit_code != 0
 
+    def test_config_not_found_with_issues_input(self, tmp_path: Path, monkeypatch) -> None:
+        class _FakeGitHubAdapter:
+            def fetch_task_descriptions_by_numbers(
+                self, repo: str, issue_numbers: list[int]
+            ) -> list[str]:
+                return ["Implement auth flow"]
+
+        monkeypatch.setattr(estimate_command, "GitHubGhCliAdapter", _FakeGitHubAdapter)
+        missing = str(tmp_path / "no_such_config.yaml")
+        result = runner.invoke(
+            app,
+            ["estimate", "--issues", "7", "--repo", "o/r", "--config", missing],
+        )
+        assert result.exit_code == 2
+        assert "Config file not found" in result.output
+
+    def test_github_error_reported_before_config_error(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        class _FailingGitHubAdapter:
+            def fetch_task_descriptions_by_numbers(
+                self, repo: str, issue_numbers: list[int]
+            ) -> list[str]:
+                raise GitHubAdapterError("rate limited")
+
+        monkeypatch.setattr(estimate_command, "GitHubGhCliAdapter", _FailingGitHubAdapter)
+        missing = str(tmp_path / "no_such_config.yaml")
+        result = runner.invoke(
+            app,
+            ["estimate", "--issues", "7", "--repo", "o/r", "--config", missing],
+        )
+        assert result.exit_code == 1
+        assert "GitHub error: rate limited" in result.output
+        assert "Config file not found" not in result.output
+
 
 # ---------------------------------------------------------------------------
 # Calibrate
@@ -327,6 +398,23 @@ class TestCalibrate:
         result = runner.invoke(app, ["calibrate", "--db", db_path])
         assert result.exit_code != 0
 
+    def test_calibrate_prints_aligned_summary_table(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "calibration.db"
+        with SQLiteCalibrationStore(db_path) as store:
+            for index in range(6):
+                store.insert_observation(_calibration_observation("feature", 0.1 * index))
+                store.insert_observation(_calibration_observation("documentation", 0.05 * index))
+
+        result = runner.invoke(app, ["calibrate", "--db", str(db_path)])
+
+        assert result.exit_code == 0
+        header, separator, *rows = result.output.splitlines()
+        assert header.split(" | ")[0] == "week_start"
+        assert len(rows) == 2
+        column_starts = [index for index, char in enumerate(separator) if char == "+"]
+        for line in (header, *rows):
+            assert [index for index, char in enumerate(line) if char == "|"] == column_starts
+
 
 # ---------------------------------------------------------------------------
 # Validate
@@ -450,3 +538,38 @@ class TestEstimateHistoryFile:
         data = json.loads(result.output)
         task = data["tasks"][0]
         assert task["modifiers"]["warm_context"] == 1.0
+
+    def test_default_data_json_in_cwd_is_used(self, tmp_path: Path, monkeypatch) -> None:
+        import json
+        from datetime import datetime, timedelta, timezone
+
+        recent = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        (tmp_path / "data.json").write_text(
+            json.dumps({"dispatches": [
+                {"agent": "codex", "project": "proj", "completed_at": recent}
+            ]})
+        )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(app, ["estimate", "--format", "json", "Add a button"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["tasks"][0]["modifiers"]["warm_context"] < 1.0
+
+    def test_invalid_input_skips_config_and_history_loads(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        calls: list[str] = []
+        monkeypatch.setattr(
+            estimate_command, "infer_warm_context", lambda *a, **k: calls.append("history")
+        )
+        monkeypatch.setattr(
+            estimate_command, "_load_estimation_config", lambda *a: calls.append("config")
+        )
+        for args in (
+            ["--file", str(tmp_path / "missing.txt")],
+            ["--issues", "1"],
+            ["--issues", "x", "--repo", "owner/name"],
+        ):
+            result = runner.invoke(app, ["estimate", *args])
+            assert result.exit_code == 2, args
+        assert calls == []
@@ -7,7 +7,13 @@ from pathlib import Path
 import pytest
 
 from agent_estimate.adapters import config_loader
-from agent_estimate.adapters.config_loader import load_config, load_default_config
+from agent_estimate.adapters.config_loader import (
+    load_config,
+    load_default_config,
+    refresh_agent_entry_points,
+)
+
+_REAL_ITER_AGENT_ENTRY_POINTS = config_loader._iter_agent_entry_points
 
 VALID_CONFIG = """\
 agents:
@@ -123,6 +129,101 @@ settings:
     assert config.settings.metr_fallback_threshold == pytest.approx(30.0)
 
 
+def test_load_config_reuses_parsed_config_for_unchanged_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+    parse_calls: list[object] = []
+    real_load = config_loader.yaml.load
+
+    def counting_load(stream: object, Loader: type) -> object:
+        parse_calls.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(config_loader.yaml, "load", counting_load)
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+
+    assert len(parse_calls) == 1
+    assert first == second
+
+
+def test_load_config_mutation_does_not_leak_into_cache(tmp_path: Path) -> None:
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+
+    first = load_config(config_path)
+    first.agents[0].parallelism = 99
+    first.settings.friction_multiplier = 9.0
+
+    second = load_config(config_path)
+
+    assert second.agents[0].parallelism == 2
+    assert second.settings.friction_multiplier == pytest.approx(1.1)
+
+
+def test_load_config_skips_plugin_merge_without_entry_points(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+
+    def fail_discover(_: object) -> list[object]:
+        raise AssertionError("plugin merge should be skipped")
+
+    monkeypatch.setattr(config_loader, "_iter_agent_entry_points", lambda: ())
+    monkeypatch.setattr(config_loader, "discover_agent_profiles", fail_discover)
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+
+    assert first == second
+    assert first is not second
+    assert first.agents is not second.agents
+
+
+def test_load_default_config_agents_list_is_not_shared() -> None:
+    first = load_default_config()
+    first.agents.append(first.agents[0].model_copy(update={"name": "Extra"}))
+
+    assert "Extra" not in [agent.name for agent in load_default_config().agents]
+
+
+def test_load_config_reparses_after_file_changes(tmp_path: Path) -> None:
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+    assert load_config(config_path).settings.friction_multiplier == pytest.approx(1.1)
+
+    _write(tmp_path, "config.yaml", VALID_CONFIG.replace("1.1", "1.25"))
+
+    assert load_config(config_path).settings.friction_multiplier == pytest.approx(1.25)
+
+
+def test_load_config_writes_and_reads_json_sidecar_when_enabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(config_loader.CONFIG_CACHE_ENV, "1")
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+
+    first = load_config(config_path)
+    cache_path = tmp_path / "config.yaml.cache.json"
+    assert cache_path.exists()
+
+    def fail_load(_: object, Loader: type) -> object:
+        raise AssertionError("YAML should not be parsed when the sidecar is fresh")
+
+    config_loader._load_validated_config.cache_clear()
+    monkeypatch.setattr(config_loader.yaml, "load", fail_load)
+
+    assert load_config(config_path) == first
+
+
+def test_load_config_skips_json_sidecar_by_default(tmp_path: Path) -> None:
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+
+    load_config(config_path)
+
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
 def test_load_default_config_has_expected_profiles() -> None:
     config = load_default_config()
 
@@ -213,3 +314,53 @@ def test_load_config_discovers_callable_entry_point_profiles(
 
     assert [agent.name for agent in config.agents] == ["Claude", "Gemini"]
     assert config.agents[1].model_tier == "gemini-3-pro"
+
+
+def test_entry_point_scan_is_cached_until_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    scans: list[None] = []
+
+    def fake_entry_points() -> dict[str, list[_FakeEntryPoint]]:
+        scans.append(None)
+        plugin = _FakeEntryPoint("codex_plugin", _CodexPluginProfile())
+        return {config_loader.ENTRY_POINT_GROUP: [plugin]}
+
+    monkeypatch.setattr(config_loader, "_iter_agent_entry_points", _REAL_ITER_AGENT_ENTRY_POINTS)
+    monkeypatch.setattr(config_loader, "entry_points", fake_entry_points)
+    refresh_agent_entry_points()
+
+    first = config_loader.discover_plugin_profiles()
+    second = config_loader.discover_plugin_profiles()
+    assert len(scans) == 1
+    assert [profile.name for profile in second] == ["Codex"]
+    assert second[0] == first[0]
+    assert second[0] is not first[0]
+
+    refresh_agent_entry_points()
+    config_loader.discover_plugin_profiles()
+    assert len(scans) == 2
+
+    refresh_agent_entry_points()
+
+
+def test_discovered_plugin_profiles_are_not_shared(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin = _FakeEntryPoint("codex_plugin", _CodexPluginProfile())
+    monkeypatch.setattr(config_loader, "_iter_agent_entry_points", lambda: [plugin])
+    config_path = _write(tmp_path, "config.yaml", VALID_CONFIG)
+    config_loader._cached_entry_point_profile.cache_clear()
+
+    first = load_config(config_path)
+    codex = next(agent for agent in first.agents if agent.name == "Codex")
+    codex.parallelism = 99
+    codex.capabilities.append("mutated")
+
+    second = load_config(config_path)
+    codex_again = next(agent for agent in second.agents if agent.name == "Codex")
+
+    assert codex_again.parallelism == 5
+    assert "mutated" not in codex_again.capabilities
+    assert config_loader.discover_plugin_profiles()[0].parallelism == 5
+
+    config_loader._cached_entry_point_profile.cache_clear()
+
@@ -59,3 +59,16 @@ class TestLoadConfigYamlRootList:
         path = _write(tmp_path, "string.yaml", "just a string\n")
         with pytest.raises(ValueError, match="root must be a YAML mapping"):
             load_config(path)
+
+
+# ---------------------------------------------------------------------------
+# Invalid encoding
+# ---------------------------------------------------------------------------
+
+
+class TestLoadConfigInvalidEncoding:
+    def test_non_utf8_bytes_raise_parse_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "latin1.yaml"
+        path.write_bytes(b"agents: caf\xe9\n")
+        with pytest.raises(ValueError, match="Failed to parse YAML config"):
+            load_config(path)
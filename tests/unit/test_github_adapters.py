@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
 import json
+import subprocess
+import threading
 from collections import defaultdict
 from collections.abc import Mapping
+from http.client import HTTPMessage
+from types import SimpleNamespace
+from urllib.request import Request
 
+import pytest
+
+from agent_estimate.adapters import github_rest
+from agent_estimate.adapters.github_adapter import GitHubAdapterError, build_task_description
 from agent_estimate.adapters.github_ghcli import GitHubGhCliAdapter
 from agent_estimate.adapters.github_rest import GitHubRestAdapter
 
@@ -36,6 +47,40 @@ def test_rest_adapter_fetches_issues_by_number_and_builds_task_descriptions() ->
     assert issues[1].task_description == "Write tests"
 
 
+def test_rest_adapter_fetches_issues_concurrently_and_keeps_order() -> None:
+    second_requested = threading.Event()
+
+    def request_fn(url: str, _: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+        number = int(url.rsplit("/", 1)[-1])
+        if number == 1:
+            # Only completes if issue 2 is requested while issue 1 is in flight.
+            assert second_requested.wait(timeout=5)
+        else:
+            second_requested.set()
+        payload: dict[str, object] = {"number": number, "title": f"Issue {number}", "body": ""}
+        if number == 3:
+            payload["pull_request"] = {}
+        return 200, {}, json.dumps(payload)
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+    issues = adapter.fetch_issues_by_numbers("acme/repo", [1, 2, 3])
+
+    assert [issue.number for issue in issues] == [1, 2]
+
+
+def test_rest_adapter_accepts_bytes_bodies_and_previews_errors() -> None:
+    def request_fn(url: str, _: Mapping[str, str]) -> tuple[int, dict[str, str], bytes]:
+        if url.endswith("/1"):
+            return 200, {}, json.dumps({"number": 1, "title": "Bytes", "body": "ok"}).encode()
+        return 404, {}, b'{"message":"Not Found"}'
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+
+    assert adapter.fetch_task_descriptions_by_numbers("acme/repo", [1]) == ["Bytes\n\nok"]
+    with pytest.raises(GitHubAdapterError, match='status 404 .*: {"message":"Not Found"}'):
+        adapter.fetch_issues_by_numbers("acme/repo", [2])
+
+
 def test_rest_adapter_handles_pagination_for_label_queries() -> None:
     first_page = [{"number": i, "title": f"Issue {i}", "body": "Body"} for i in range(1, 101)]
     second_page = [
@@ -43,10 +88,14 @@ def test_rest_adapter_handles_pagination_for_label_queries() -> None:
         {"number": 102, "title": "Issue 102", "body": "Body"},
     ]
 
+    page_two = (
+        "https://api.github.com/repos/acme/repo/issues?state=open&labels=bug&per_page=100&page=2"
+    )
+    link = f'<{page_two}>; rel="next", <{page_two}>; rel="last"'
     responses = {
         "https://api.github.com/repos/acme/repo/issues?state=open&labels=bug&per_page=100&page=1": (
             200,
-            {},
+            {"Link": link},
             json.dumps(first_page),
         ),
         "https://api.github.com/repos/acme/repo/issues?state=open&labels=bug&per_page=100&page=2": (
@@ -67,6 +116,107 @@ def test_rest_adapter_handles_pagination_for_label_queries() -> None:
     assert issues[-1].number == 102
 
 
+def test_rest_adapter_stops_paginating_without_next_link() -> None:
+    requested: list[str] = []
+    full_page = [{"number": i, "title": f"Issue {i}", "body": ""} for i in range(1, 101)]
+
+    def request_fn(url: str, _: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+        requested.append(url)
+        return 200, {}, json.dumps(full_page)
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+    issues = adapter.fetch_issues_by_label("acme/repo", "bug")
+
+    assert len(issues) == 100
+    assert len(requested) == 1
+
+
+def test_rest_adapter_reads_http_message_headers_case_insensitively() -> None:
+    page_two = "https://api.github.com/repos/acme/repo/issues?page=2"
+    first_headers = HTTPMessage()
+    first_headers["Link"] = f'<{page_two}>; rel="next"'
+    full_page = [{"number": i, "title": f"Issue {i}", "body": ""} for i in range(1, 101)]
+
+    def request_fn(url: str, _: Mapping[str, str]) -> tuple[int, HTTPMessage, str]:
+        if url == page_two:
+            return 200, HTTPMessage(), "[]"
+        return 200, first_headers, json.dumps(full_page)
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+
+    assert len(adapter.fetch_issues_by_label("acme/repo", "bug")) == 100
+    assert github_rest._case_insensitive_headers(first_headers) is first_headers
+
+
+@pytest.mark.parametrize("etag_cache", [True, False])
+def test_rest_adapter_revalidates_label_pages_with_etag(etag_cache: bool) -> None:
+    sent: list[Mapping[str, str]] = []
+    page = [{"number": 1, "title": "Issue 1", "body": ""}]
+
+    def request_fn(url: str, headers: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+        sent.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, ""
+        return 200, {"ETag": '"v1"'}, json.dumps(page)
+
+    adapter = GitHubRestAdapter(
+        token_provider=lambda: "test-token",
+        request_fn=request_fn,
+        etag_cache=etag_cache,
+    )
+    first = adapter.fetch_issues_by_label("acme/repo", "bug")
+    second = adapter.fetch_issues_by_label("acme/repo", "bug")
+
+    assert [issue.number for issue in first] == [issue.number for issue in second] == [1]
+    assert "If-None-Match" not in sent[0]
+    assert sent[1].get("If-None-Match") == ('"v1"' if etag_cache else None)
+
+
+def test_rest_adapter_etag_cache_is_off_by_default() -> None:
+    sent: list[Mapping[str, str]] = []
+
+    def request_fn(url: str, headers: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+        sent.append(headers)
+        return 200, {"ETag": '"v1"'}, "[]"
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+    adapter.fetch_issues_by_label("acme/repo", "bug")
+    adapter.fetch_issues_by_label("acme/repo", "bug")
+
+    assert adapter._etag_cache is None
+    assert all("If-None-Match" not in headers for headers in sent)
+
+
+@pytest.mark.parametrize("use_msgspec", [True, False])
+def test_rest_adapter_decodes_issues_with_and_without_msgspec(
+    monkeypatch: pytest.MonkeyPatch, use_msgspec: bool
+) -> None:
+    if use_msgspec:
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(github_rest, "_ISSUE_DECODER", None)
+        monkeypatch.setattr(github_rest, "_ISSUE_PAGE_DECODER", None)
+    page = [
+        {"number": 1, "title": "Issue", "body": None, "labels": []},
+        {"number": 2, "title": "PR", "body": "", "pull_request": {"url": "x"}},
+    ]
+    responses = {
+        "https://api.github.com/repos/acme/repo/issues/1": json.dumps(page[0]),
+        "https://api.github.com/repos/acme/repo/issues/2": json.dumps(page[1]),
+        "https://api.github.com/repos/acme/repo/issues/3": json.dumps(["not", "an", "issue"]),
+    }
+
+    def request_fn(url: str, _: Mapping[str, str]) -> tuple[int, dict[str, str], str]:
+        return 200, {}, responses.get(url, json.dumps(page))
+
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", request_fn=request_fn)
+
+    assert [issue.number for issue in adapter.fetch_issues_by_label("acme/repo", "bug")] == [1]
+    assert [issue.number for issue in adapter.fetch_issues_by_numbers("acme/repo", [1, 2])] == [1]
+    with pytest.raises(GitHubAdapterError, match="Unexpected payload for issue #3"):
+        adapter.fetch_issues_by_numbers("acme/repo", [3])
+
+
 def test_rest_adapter_retries_when_rate_limited() -> None:
     calls = defaultdict(int)
     sleep_calls: list[float] = []
@@ -94,10 +244,212 @@ def test_rest_adapter_retries_when_rate_limited() -> None:
     assert sleep_calls == [2.0]
 
 
+class _FakeResponse:
+    def __init__(
+        self, number: int, *, gzipped: bool = False, redirect_to: str | None = None
+    ) -> None:
+        self.status = 200
+        self.will_close = False
+        self._body = json.dumps({"number": number, "title": f"Issue {number}", "body": ""}).encode()
+        self._headers = [("Content-Type", "application/json")]
+        if redirect_to is not None:
+            self.status = 301
+            self._body = b'{"message":"Moved Permanently"}'
+            self._headers.append(("Location", redirect_to))
+        if gzipped:
+            self._body = gzip.compress(self._body)
+            self._headers.append(("Content-Encoding", "gzip"))
+
+    def read(self) -> bytes:
+        return self._body
+
+    @property
+    def msg(self) -> HTTPMessage:
+        message = HTTPMessage()
+        for key, value in self._headers:
+            message[key] = value
+        return message
+
+    def getheader(self, name: str, default: str | None = None) -> str | None:
+        return self.msg.get(name, default)
+
+
+class _FakeConnection:
+    def __init__(self, host: str, timeout: float, redirects: Mapping[str, str]) -> None:
+        self.host = host
+        self.redirects = redirects
+        self.requests: list[str] = []
+        self.request_headers: list[Mapping[str, str]] = []
+        self.drop_next = False
+        self.closed = False
+
+    def request(self, method: str, path: str, headers: Mapping[str, str]) -> None:
+        assert method == "GET"
+        if self.drop_next:
+            raise github_rest.http.client.RemoteDisconnected("idle timeout")
+        self.requests.append(path)
+        self.request_headers.append(headers)
+
+    def getresponse(self) -> _FakeResponse:
+        gzipped = self.request_headers[-1].get("Accept-Encoding") == "gzip"
+        path = self.requests[-1]
+        return _FakeResponse(
+            int(path.rsplit("/", 1)[-1]),
+            gzipped=gzipped,
+            redirect_to=self.redirects.get(f"{self.host}{path}"),
+        )
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture()
+def fake_redirects() -> dict[str, str]:
+    """``host/path`` -> ``Location`` for fake connections to answer with a 301."""
+    return {}
+
+
+@pytest.fixture()
+def fake_connections(
+    monkeypatch: pytest.MonkeyPatch, fake_redirects: dict[str, str]
+) -> list[_FakeConnection]:
+    """Route pooled HTTPS connections to fakes; returns them in creation order."""
+    created: list[_FakeConnection] = []
+    for name in ("https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+    def connect(host: str, timeout: float) -> _FakeConnection:
+        connection = _FakeConnection(host, timeout, fake_redirects)
+        created.append(connection)
+        return connection
+
+    monkeypatch.setattr(github_rest.http.client, "HTTPSConnection", connect)
+    return created
+
+
+def test_rest_adapter_reuses_keep_alive_connection(
+    fake_connections: list[_FakeConnection],
+) -> None:
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", max_workers=1)
+
+    adapter.fetch_issues_by_numbers("acme/repo", [1, 2])
+    assert len(fake_connections) == 1
+    assert fake_connections[0].requests == [
+        "/repos/acme/repo/issues/1",
+        "/repos/acme/repo/issues/2",
+    ]
+
+    fake_connections[0].drop_next = True
+    issues = adapter.fetch_issues_by_numbers("acme/repo", [3])
+    assert [issue.number for issue in issues] == [3]
+    assert fake_connections[0].closed
+    assert len(fake_connections) == 2
+
+    adapter.close()
+    assert fake_connections[1].closed
+
+
+def test_rest_adapter_requests_and_inflates_gzip(
+    fake_connections: list[_FakeConnection],
+) -> None:
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", max_workers=1)
+
+    issues = adapter.fetch_issues_by_numbers("acme/repo", [7])
+
+    assert fake_connections[0].request_headers[0]["Accept-Encoding"] == "gzip"
+    assert [(issue.number, issue.title) for issue in issues] == [(7, "Issue 7")]
+
+
+def test_rest_adapter_follows_redirects_on_pooled_connections(
+    fake_connections: list[_FakeConnection], fake_redirects: dict[str, str]
+) -> None:
+    fake_redirects["api.github.com/repos/acme/old-name/issues/5"] = "/repositories/42/issues/5"
+    fake_redirects["api.github.com/repositories/42/issues/6"] = (
+        "https://mirror.example.com/issues/6"
+    )
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", max_workers=1)
+
+    issues = adapter.fetch_issues_by_numbers("acme/old-name", [5])
+
+    assert [issue.number for issue in issues] == [5]
+    assert len(fake_connections) == 1
+    assert fake_connections[0].requests == [
+        "/repos/acme/old-name/issues/5",
+        "/repositories/42/issues/5",
+    ]
+    assert fake_connections[0].request_headers[1]["Authorization"] == "Bearer test-token"
+
+    adapter._request(f"{github_rest.BASE_URL}/repositories/42/issues/6")
+    mirror = fake_connections[1]
+    assert mirror.host == "mirror.example.com"
+    assert mirror.requests == ["/issues/6"]
+    assert "Authorization" not in mirror.request_headers[0]
+
+
+def test_rest_adapter_stops_after_too_many_redirects(
+    fake_connections: list[_FakeConnection], fake_redirects: dict[str, str]
+) -> None:
+    fake_redirects["api.github.com/repos/acme/repo/issues/1"] = "/repos/acme/repo/issues/1"
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", max_workers=1)
+
+    with pytest.raises(GitHubAdapterError, match="exceeded 5 redirects"):
+        adapter.fetch_issues_by_numbers("acme/repo", [1])
+
+
+def test_rest_adapter_uses_urllib_when_a_proxy_is_configured(
+    fake_connections: list[_FakeConnection], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: list[str] = []
+
+    payload = json.dumps({"number": 8, "title": "Proxied", "body": ""}).encode()
+
+    def fake_urlopen(request: Request, timeout: float) -> contextlib.nullcontext[object]:
+        opened.append(request.full_url)
+        response = SimpleNamespace(status=200, headers=HTTPMessage(), read=lambda: payload)
+        return contextlib.nullcontext(response)
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setattr(github_rest, "urlopen", fake_urlopen)
+    adapter = GitHubRestAdapter(token_provider=lambda: "test-token", max_workers=1)
+
+    issues = adapter.fetch_issues_by_numbers("acme/repo", [8])
+
+    assert [issue.title for issue in issues] == ["Proxied"]
+    assert opened == ["https://api.github.com/repos/acme/repo/issues/8"]
+    assert fake_connections == []
+
+    monkeypatch.setenv("NO_PROXY", "api.github.com")
+    adapter.fetch_issues_by_numbers("acme/repo", [9])
+    assert len(fake_connections) == 1
+
+
+def test_gh_auth_token_is_resolved_once_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="gho_cached\n", stderr="")
+
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setattr(github_rest.subprocess, "run", fake_run)
+    github_rest._invalidate_token_cache()
+    try:
+        first = GitHubRestAdapter(request_fn=lambda *_: (200, {}, "[]"))
+        second = GitHubRestAdapter(request_fn=lambda *_: (200, {}, "[]"))
+    finally:
+        github_rest._invalidate_token_cache()
+
+    assert first._token == second._token == "gho_cached"
+    assert calls == [["gh", "auth", "token"]]
+
+
 def test_gh_cli_adapter_fetches_issues_by_number_and_label() -> None:
     def runner(args: list[str]) -> str:
-        if args[:3] == ["gh", "issue", "view"]:
-            return json.dumps({"number": 9, "title": "CLI title", "body": "CLI body"})
+        if args[:3] == ["gh", "api", "graphql"]:
+            assert "i0: issue(number: 9)" in args[4]
+            assert args[5:] == ["-f", "owner=acme", "-f", "name=repo"]
+            issue = {"number": 9, "title": "CLI title", "body": "CLI body"}
+            return json.dumps({"data": {"repository": {"i0": issue}}})
         if args[:3] == ["gh", "issue", "list"]:
             return json.dumps(
                 [
@@ -113,3 +465,50 @@ def test_gh_cli_adapter_fetches_issues_by_number_and_label() -> None:
 
     assert by_number == ["CLI title\n\nCLI body"]
     assert by_label == ["Label title\n\nBody", "Second title"]
+
+
+def test_gh_cli_adapter_batches_issue_numbers_into_one_graphql_call() -> None:
+    calls: list[list[str]] = []
+
+    def runner(args: list[str]) -> str:
+        calls.append(args)
+        repository = {
+            "i0": {"number": 3, "title": "Third", "body": None},
+            "i1": {"number": 1, "title": "First", "body": "Body"},
+        }
+        return json.dumps({"data": {"repository": repository}})
+
+    adapter = GitHubGhCliAdapter(runner=runner)
+    issues = adapter.fetch_issues_by_numbers("acme/repo", [3, 1])
+
+    assert len(calls) == 1
+    assert [issue.number for issue in issues] == [3, 1]
+    assert issues[0].task_description == "Third"
+
+
+def test_gh_cli_adapter_falls_back_to_issue_view_when_graphql_fails() -> None:
+    def runner(args: list[str]) -> str:
+        if args[:3] == ["gh", "api", "graphql"]:
+            raise GitHubAdapterError("graphql unavailable")
+        number = int(args[3])
+        return json.dumps({"number": number, "title": f"Issue {number}", "body": ""})
+
+    adapter = GitHubGhCliAdapter(runner=runner)
+
+    assert adapter.fetch_task_descriptions_by_numbers("acme/repo", [4, 5]) == [
+        "Issue 4",
+        "Issue 5",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("title", "body", "expected"),
+    [
+        ("  Title  ", None, "Title"),
+        ("Title", "", "Title"),
+        ("Title", "  \n ", "Title"),
+        (" Title", "  Body text \n", "Title\n\nBody text"),
+    ],
+)
+def test_build_task_description(title: str, body: str | None, expected: str) -> None:
+    assert build_task_description(title, body) == expected
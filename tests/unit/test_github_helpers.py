@@ -53,3 +53,11 @@ class TestParseIssueSelection:
     def test_large_issue_numbers(self) -> None:
         result = parse_issue_selection("1000,9999")
         assert result == [1000, 9999]
+
+    def test_non_decimal_digit_characters_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Invalid issue token: 1²"):
+            parse_issue_selection("1²")
+
+    def test_only_one_leading_hash_stripped(self) -> None:
+        with pytest.raises(ValueError, match="Invalid issue token: ##1"):
+            parse_issue_selection("##1")
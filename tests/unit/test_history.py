@@ -4,12 +4,23 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from agent_estimate.core.history import infer_warm_context
+from agent_estimate.core import history
+from agent_estimate.core.history import _decay_to_warm_context, infer_warm_context
+
+
+@pytest.fixture(autouse=True)
+def _clear_history_cache() -> Iterator[None]:
+    history._cached_most_recent.cache_clear()
+    history._cached_dispatches.cache_clear()
+    yield
+    history._cached_most_recent.cache_clear()
+    history._cached_dispatches.cache_clear()
 
 
 @pytest.fixture()
@@ -89,6 +100,25 @@ def test_stale_dispatch_returns_10(tmp_path: Path, ref_time: datetime) -> None:
     assert result.source == "auto"
 
 
+@pytest.mark.parametrize(
+    ("hours_ago", "expected"),
+    [
+        (-1.0, 0.3),
+        (0.0, 0.3),
+        (1.99, 0.3),
+        (2.0, 0.5),
+        (11.99, 0.5),
+        (12.0, 0.7),
+        (23.99, 0.7),
+        (24.0, 1.0),
+        (1000.0, 1.0),
+    ],
+)
+def test_decay_band_boundaries(hours_ago: float, expected: float) -> None:
+    """Each band's upper bound is exclusive."""
+    assert _decay_to_warm_context(hours_ago) == expected
+
+
 # --- Filtering tests ---
 
 
@@ -150,6 +180,43 @@ def test_malformed_json_returns_10_with_warning(
     assert "Malformed JSON" in caplog.text
 
 
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_non_utf8_history_returns_10_with_warning(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    with_orjson: bool,
+) -> None:
+    """Undecodable bytes are reported like malformed JSON with either parser."""
+    if not with_orjson:
+        monkeypatch.setattr(history, "orjson", None)
+    path = tmp_path / "latin1.json"
+    path.write_bytes(b'{"dispatches": [{"agent": "caf\xe9"}]}')
+    with caplog.at_level(logging.WARNING, logger="agent_estimate"):
+        result = infer_warm_context(path)
+    assert result.value == 1.0
+    assert result.source == "default"
+    assert "Malformed JSON" in caplog.text
+
+
+def test_stdlib_fallback_matches_orjson(
+    tmp_path: Path, ref_time: datetime, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Dispatches parse the same whether or not orjson is installed."""
+    dispatches = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=3)).isoformat(),
+        },
+        "not-a-dict",
+    ]
+    path = _write_history(tmp_path, dispatches)
+    with_orjson = history._load_dispatches(path)
+    monkeypatch.setattr(history, "orjson", None)
+    assert history._load_dispatches(path) == with_orjson == [dispatches[0]]
+
+
 def test_missing_dispatches_key_returns_10(
     tmp_path: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -274,3 +341,137 @@ def test_mixed_agent_history_requires_filter(
         path, agent="codex", reference_time=ref_time
     )
     assert result_filtered.value == 1.0
+
+
+# --- Caching ---
+
+
+def test_unchanged_history_is_not_reparsed(
+    tmp_path: Path, ref_time: datetime, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated inference on an unmodified file reuses the cached scan."""
+    dispatches = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=1)).isoformat(),
+        }
+    ]
+    path = _write_history(tmp_path, dispatches)
+    calls: list[Path] = []
+    real_load = history._load_dispatches
+
+    def counting_load(p: Path) -> list[dict]:
+        calls.append(p)
+        return real_load(p)
+
+    monkeypatch.setattr(history, "_load_dispatches", counting_load)
+
+    first = infer_warm_context(path, agent="codex", reference_time=ref_time)
+    later = infer_warm_context(
+        path, agent="codex", reference_time=ref_time + timedelta(hours=12)
+    )
+
+    assert len(calls) == 1
+    assert first.value == 0.3
+    # Recency is still computed against each call's reference time.
+    assert later.value == 0.7
+
+
+def test_parse_is_shared_across_filters(
+    tmp_path: Path, ref_time: datetime, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Different agent/project filters on one file version parse it once."""
+    dispatches = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=1)).isoformat(),
+        },
+        {
+            "agent": "claude",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=6)).isoformat(),
+        },
+    ]
+    path = _write_history(tmp_path, dispatches)
+    calls: list[Path] = []
+    real_load = history._load_dispatches
+
+    def counting_load(p: Path) -> list[dict]:
+        calls.append(p)
+        return real_load(p)
+
+    monkeypatch.setattr(history, "_load_dispatches", counting_load)
+
+    codex = infer_warm_context(path, agent="codex", reference_time=ref_time)
+    claude = infer_warm_context(path, agent="claude", reference_time=ref_time)
+
+    assert len(calls) == 1
+    assert codex.value == 0.3
+    assert claude.value == 0.5
+
+
+def test_modified_history_invalidates_cache(tmp_path: Path, ref_time: datetime) -> None:
+    """Rewriting the history file is picked up on the next call."""
+    stale = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=30)).isoformat(),
+        }
+    ]
+    path = _write_history(tmp_path, stale)
+    assert infer_warm_context(path, reference_time=ref_time).value == 1.0
+
+    fresh = stale + [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(minutes=30)).isoformat(),
+        }
+    ]
+    path.write_text(json.dumps({"dispatches": fresh}), encoding="utf-8")
+
+    assert infer_warm_context(path, reference_time=ref_time).value == 0.3
+
+
+def test_caller_stat_is_used_for_cache_key(tmp_path: Path, ref_time: datetime) -> None:
+    """A stat result passed by the caller keys the cache without a re-stat."""
+    dispatches = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(minutes=30)).isoformat(),
+        }
+    ]
+    path = _write_history(tmp_path, dispatches)
+    stat = path.stat()
+
+    result = infer_warm_context(path, reference_time=ref_time, history_stat=stat)
+
+    assert result.value == 0.3
+    assert history._cached_most_recent.cache_info().currsize == 1
+    # A plain call stats the unchanged file itself and hits the same entry.
+    infer_warm_context(path, reference_time=ref_time)
+    assert history._cached_most_recent.cache_info().hits == 1
+
+
+def test_build_detail_false_skips_detail(tmp_path: Path, ref_time: datetime) -> None:
+    """Value-only callers get the same value without a detail string."""
+    dispatches = [
+        {
+            "agent": "codex",
+            "project": "agent-estimate",
+            "completed_at": (ref_time - timedelta(hours=6)).isoformat(),
+        }
+    ]
+    path = _write_history(tmp_path, dispatches)
+
+    full = infer_warm_context(path, reference_time=ref_time)
+    lean = infer_warm_context(path, reference_time=ref_time, build_detail=False)
+
+    assert full.detail == "codex active 6h ago on agent-estimate"
+    assert lean.value == full.value == 0.5
+    assert lean.source == "auto"
+    assert lean.detail is None
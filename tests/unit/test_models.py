@@ -204,3 +204,17 @@ class TestFrozenDataclasses:
         )
         with pytest.raises(AttributeError):
             sizing.tier = SizeTier.XL  # type: ignore[misc]
+
+    def test_result_dataclasses_use_slots(self) -> None:
+        import dataclasses
+
+        from agent_estimate.core import models
+
+        for name in dir(models):
+            obj = getattr(models, name)
+            if (
+                isinstance(obj, type)
+                and dataclasses.is_dataclass(obj)
+                and obj.__module__ == models.__name__
+            ):
+                assert "__slots__" in vars(obj), name
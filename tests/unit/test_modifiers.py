@@ -161,6 +161,15 @@ class TestModifierFloor:
         assert "0.10" in caplog.records[0].message
         assert "clamped" in caplog.records[0].message
 
+    def test_floor_warning_logged_on_every_call(self, caplog: pytest.LogCaptureFixture) -> None:
+        import logging
+
+        with caplog.at_level(logging.WARNING, logger="agent_estimate.core.modifiers"):
+            first = build_modifier_set(spec_clarity=0.3, warm_context=0.3)
+            second = build_modifier_set(spec_clarity=0.3, warm_context=0.3)
+        assert first is second
+        assert len(caplog.records) == 2
+
     def test_no_warning_when_floor_not_triggered(self, caplog: pytest.LogCaptureFixture) -> None:
         import logging
 
@@ -8,6 +8,7 @@ import pytest
 
 from agent_estimate.core.human_comparison import compute_human_equivalent, get_human_multiplier
 from agent_estimate.core.models import (
+    EstimationCategory,
     MetrWarning,
     ReviewMode,
     SizeTier,
@@ -24,6 +25,7 @@ from agent_estimate.core.pert import (
     check_metr_threshold,
     compute_pert,
     estimate_task,
+    estimate_task_with_human_equivalent,
     load_metr_thresholds,
 )
 from agent_estimate.core.sizing import TIER_BASELINES, classify_task
@@ -218,6 +220,11 @@ class TestMetrThresholds:
         assert "opus" in thresholds
         assert thresholds["opus"] == pytest.approx(90.0)
 
+    def test_load_metr_thresholds_returns_independent_copies(self) -> None:
+        first = load_metr_thresholds()
+        first["opus"] = 1.0
+        assert load_metr_thresholds()["opus"] == pytest.approx(90.0)
+
     def test_check_within_threshold_returns_none(self) -> None:
         thresholds = {"opus": 90.0}
         result = check_metr_threshold("opus", 50.0, thresholds=thresholds)
@@ -355,6 +362,38 @@ class TestEstimateTask:
         assert result.review_minutes == pytest.approx(0.0)
         assert result.total_expected_minutes == pytest.approx(result.pert.expected)
 
+    def test_with_human_equivalent_matches_two_pass_estimate(self) -> None:
+        sizing = self._make_sizing(SizeTier.M)
+        mods = build_modifier_set(spec_clarity=0.7)
+        first = estimate_task(
+            sizing, mods, review_mode=ReviewMode.STANDARD, thresholds={"opus": 90.0}
+        )
+        expected = estimate_task(
+            sizing,
+            mods,
+            review_mode=ReviewMode.STANDARD,
+            thresholds={"opus": 90.0},
+            human_equivalent_minutes=compute_human_equivalent(
+                first.total_expected_minutes, sizing.task_type
+            ),
+        )
+
+        result = estimate_task_with_human_equivalent(
+            sizing, mods, review_mode=ReviewMode.STANDARD, thresholds={"opus": 90.0}
+        )
+
+        assert result == expected
+
+    def test_estimation_category_recorded_without_copy(self) -> None:
+        sizing = self._make_sizing()
+        mods = build_modifier_set()
+
+        assert estimate_task(sizing, mods).estimation_category is None
+        result = estimate_task_with_human_equivalent(
+            sizing, mods, estimation_category=EstimationCategory.CODING
+        )
+        assert result.estimation_category is EstimationCategory.CODING
+
     def test_with_review_overhead_standard(self) -> None:
         sizing = self._make_sizing()
         mods = build_modifier_set()
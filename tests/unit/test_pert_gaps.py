@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from agent_estimate.core import pert
 from agent_estimate.core.models import SizeTier, SizingResult, TaskType
 from agent_estimate.core.modifiers import build_modifier_set
 from agent_estimate.core.pert import (
@@ -35,6 +37,12 @@ def _sizing(tier: SizeTier = SizeTier.S) -> SizingResult:
 
 
 class TestLoadMetrThresholdsMalformed:
+    @pytest.fixture(autouse=True)
+    def _fresh_thresholds_cache(self) -> Iterator[None]:
+        pert._metr_thresholds.cache_clear()
+        yield
+        pert._metr_thresholds.cache_clear()
+
     def test_malformed_yaml_raises_runtime_error(self, tmp_path: Path) -> None:
         malformed_yaml = "models:\n  opus: not_a_dict_with_p80\n"
 
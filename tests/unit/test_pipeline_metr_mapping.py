@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from agent_estimate.cli.commands import _pipeline
 from agent_estimate.cli.commands._pipeline import run_estimate_pipeline
 from agent_estimate.core.models import (
@@ -12,6 +14,8 @@ from agent_estimate.core.models import (
     SizeTier,
     SizingResult,
     TaskType,
+    Wave,
+    WaveAssignment,
 )
 
 
@@ -81,3 +85,125 @@ class TestPipelineMetrMapping:
         task = report.tasks[0]
         assert task.agent == "Claude"
         assert task.metr_warning is None
+
+    def test_default_agent_reuses_estimation_pass_warning(self, monkeypatch) -> None:
+        calls: list[str] = []
+
+        def counting_check(model_key: str, *args, **kwargs) -> None:
+            calls.append(model_key)
+
+        monkeypatch.setattr(_pipeline, "check_metr_threshold", counting_check)
+        report = run_estimate_pipeline(
+            ["Add retry logic to the HTTP client", "Implement OAuth login flow"],
+            _claude_frontier_config(),
+        )
+
+        assert calls == []
+        assert all(task.agent == "Claude" for task in report.tasks)
+
+    def test_caller_supplied_thresholds_are_used(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            _pipeline,
+            "load_metr_thresholds",
+            lambda: pytest.fail("packaged thresholds should not be loaded"),
+        )
+        report = run_estimate_pipeline(
+            ["Add retry logic to the HTTP client"],
+            _claude_frontier_config(),
+            thresholds={"opus_4_6": 1.0},
+        )
+
+        assert report.tasks[0].metr_warning is not None
+        assert "(1m)" in report.tasks[0].metr_warning
+
+
+class TestPipelineConcurrency:
+    def test_thread_pool_matches_sequential_order(self) -> None:
+        descriptions = [
+            "Fix typo in README",
+            "Implement OAuth login flow with refresh tokens and tests",
+            "Research vector database options",
+            "Add retry logic to the HTTP client",
+        ]
+        config = _claude_frontier_config()
+
+        sequential = run_estimate_pipeline(descriptions, config)
+        threaded = run_estimate_pipeline(descriptions, config, max_workers=4)
+
+        assert threaded == sequential
+
+    def test_duplicate_descriptions_are_estimated_once(self, monkeypatch) -> None:
+        calls: list[str] = []
+        original = _pipeline.classify_task
+
+        def counting_classify(desc: str):
+            calls.append(desc)
+            return original(desc)
+
+        monkeypatch.setattr(_pipeline, "classify_task", counting_classify)
+        descriptions = ["Add retry logic to the HTTP client"] * 3 + ["Implement OAuth login flow"]
+
+        report = run_estimate_pipeline(descriptions, _claude_frontier_config())
+
+        assert calls == ["Add retry logic to the HTTP client", "Implement OAuth login flow"]
+        assert len(report.tasks) == 4
+        assert report.tasks[0].effective_duration_minutes == report.tasks[2].effective_duration_minutes
+
+
+class TestReportWave:
+    def test_groups_assignments_by_agent_in_wave_order(self) -> None:
+        wave = Wave(
+            wave_number=0,
+            start_minutes=0.0,
+            end_minutes=30.0,
+            assignments=(
+                WaveAssignment(task_id=0, agent_name="Claude", slot_index=0, duration_minutes=10.0),
+                WaveAssignment(task_id=1, agent_name="Codex", slot_index=0, duration_minutes=20.0),
+                WaveAssignment(task_id=2, agent_name="Claude", slot_index=1, duration_minutes=30.0),
+            ),
+        )
+
+        report_wave = _pipeline._report_wave(wave, ["a", "b", "c"])
+
+        assert report_wave.tasks == ("a", "b", "c")
+        assert report_wave.duration_minutes == 30.0
+        assert report_wave.agent_assignments == {"Claude": ("a", "c"), "Codex": ("b",)}
+
+
+
+class TestAgentIndex:
+    def test_repeated_names_resolve_to_last_profile(self) -> None:
+        agents = [
+            AgentProfile(
+                name="Claude", capabilities=["code"], parallelism=1, cost_per_turn=0.1,
+                model_tier="frontier",
+            ),
+            AgentProfile(
+                name="Codex", capabilities=["code"], parallelism=1, cost_per_turn=0.2,
+                model_tier="production",
+            ),
+            AgentProfile(
+                name="Claude", capabilities=["code"], parallelism=1, cost_per_turn=0.3,
+                model_tier="opus",
+            ),
+        ]
+
+        index = _pipeline._AgentIndex.from_agents(agents)
+
+        assert list(index.by_name) == ["Claude", "Codex"]
+        assert index.tiers[index.by_name["Claude"]] == "opus"
+        assert index.costs[index.by_name["Claude"]] == 0.3
+        assert (index.default_name, index.default_tier) == ("Claude", "frontier")
+
+
+@pytest.mark.parametrize(
+    ("desc", "expected"),
+    [
+        ("Add retry logic", "Add retry logic"),
+        ("  \n Add retry logic  \nwith backoff\n", "Add retry logic  "),
+        ("x" * 61, "x" * 59 + "\u2026"),
+    ],
+)
+def test_truncate_name(desc: str, expected: str) -> None:
+    assert _pipeline._truncate_name(desc) == expected
+
@@ -8,6 +8,7 @@ import pytest
 from typer.testing import CliRunner
 
 from agent_estimate.cli.app import app
+from agent_estimate.cli.commands import session as session_command
 from agent_estimate.core.session import (
     DEFAULT_COORDINATION_OVERHEAD_MINUTES,
     SESSION_TYPE_DURATIONS,
@@ -260,6 +261,15 @@ class TestSessionCLIJson:
         # agent_minutes = 2 * 3 * 10 = 60m
         assert data["agent_minutes"] == pytest.approx(60.0)
 
+    def test_json_output_identical_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        args = ["session", "--agents", "3", "--rounds", "2", "--format", "json"]
+        with_orjson = runner.invoke(app, args)
+        monkeypatch.setattr(session_command, "orjson", None)
+        without_orjson = runner.invoke(app, args)
+
+        assert with_orjson.exit_code == without_orjson.exit_code == 0
+        assert with_orjson.output == without_orjson.output
+
 
 class TestSessionCLIErrors:
     """CLI session subcommand — error handling."""
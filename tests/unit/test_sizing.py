@@ -132,3 +132,9 @@ class TestBumpTierClamping:
     def test_epic_keyword_already_at_xl_no_bump_needed(self) -> None:
         result = classify_task("Massive rewrite of the entire auth system")
         assert result.tier == SizeTier.XL
+
+
+class TestClassifyTaskMemoization:
+    def test_repeated_description_returns_cached_result(self) -> None:
+        description = "Add retry logic to the HTTP client"
+        assert classify_task(description) is classify_task(description)
@@ -11,6 +11,7 @@ from agent_estimate.adapters.sqlite_store import (
     ObservationInput,
     SQLiteCalibrationStore,
     _percentile,
+    _percentiles,
 )
 
 
@@ -133,6 +134,14 @@ class TestPercentileEdgeCases:
         result = _percentile([10.0, 20.0], 50.0)
         assert result == pytest.approx(15.0)
 
+    def test_percentiles_match_individual_calls(self) -> None:
+        values = [0.5, 3.0, 1.0, 9.5, 2.25, 4.0]
+        percents = (10.0, 50.0, 90.0)
+
+        assert _percentiles(values, percents) == tuple(
+            _percentile(values, percent) for percent in percents
+        )
+
 
 # ---------------------------------------------------------------------------
 # Multiple task types in one calibrate cycle
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import random
+import sqlite3
 from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
+from agent_estimate.adapters import sqlite_store
 from agent_estimate.adapters.sqlite_store import (
     ObservationInput,
     SQLiteCalibrationStore,
@@ -136,13 +139,353 @@ def test_schema_version_table_exists(store: SQLiteCalibrationStore) -> None:
     assert row["version"] == 1
 
 
-def test_insert_rejects_invalid_negative_values(store: SQLiteCalibrationStore) -> None:
-    invalid = _observation()
-    invalid = ObservationInput(
-        **{
-            **invalid.__dict__,
-            "estimated_secs": -1.0,
-        },
-    )
+def test_observation_input_rejects_invalid_negative_values() -> None:
+    valid = _observation()
     with pytest.raises(ValueError, match="estimated_secs must be >= 0"):
-        store.insert_observation(invalid)
+        ObservationInput(
+            **{
+                **valid.__dict__,
+                "estimated_secs": -1.0,
+            },
+        )
+
+
+def test_trusted_observation_skips_validation(store: SQLiteCalibrationStore) -> None:
+    values = {**_observation().__dict__, "observed_at": None}
+    trusted = ObservationInput.trusted(**values)
+
+    assert trusted == ObservationInput(**values)
+    assert store.insert_observation(trusted) > 0
+    assert ObservationInput.trusted(**{**values, "verdict": " "}).verdict == " "
+    with pytest.raises(TypeError, match="verdict"):
+        ObservationInput.trusted(**{k: v for k, v in values.items() if k != "verdict"})
+    with pytest.raises(TypeError, match="unknown observation fields: verdcit"):
+        ObservationInput.trusted(**{**values, "verdcit": "pass"})
+
+
+def test_insert_observations_bulk_returns_ids_in_order(store: SQLiteCalibrationStore) -> None:
+    first_id = store.insert_observation(_observation(task_type="feature"))
+    batch = [
+        _observation(task_type="feature", error_ratio=0.1),
+        _observation(task_type=" bugfix ", error_ratio=0.2),
+        _observation(task_type="docs", error_ratio=0.3),
+    ]
+
+    ids = store.insert_observations(batch)
+
+    assert ids == [first_id + 1, first_id + 2, first_id + 3]
+    rows = {row["id"]: row for row in store._query_observations()}
+    assert [rows[row_id]["task_type"] for row_id in ids] == ["feature", "bugfix", "docs"]
+    assert [rows[row_id]["error_ratio"] for row_id in ids] == pytest.approx([0.1, 0.2, 0.3])
+    assert store.insert_observations([]) == []
+
+
+def test_insert_observations_rejects_invalid_batch_atomically(
+    store: SQLiteCalibrationStore,
+) -> None:
+    invalid = ObservationInput.trusted(**{**_observation().__dict__, "verdict": None})
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.insert_observations([_observation(), invalid])
+
+    assert store._query_observations() == []
+
+
+def test_store_applies_performance_pragmas_with_overrides(tmp_path: Path) -> None:
+    with SQLiteCalibrationStore(tmp_path / "tuned.db") as store:
+        assert store._connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert store._connection.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert store._connection.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+    with SQLiteCalibrationStore(tmp_path / "durable.db", pragmas={"synchronous": "FULL"}) as store:
+        assert store._connection.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+
+def test_calibrate_scan_uses_week_task_index(store: SQLiteCalibrationStore) -> None:
+    plan = store._connection.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT week_start, task_type_id, error_ratio
+        FROM observations
+        ORDER BY week_start ASC, task_type_id ASC
+        """,
+    ).fetchall()
+
+    assert any("idx_obs_week_task" in row["detail"] for row in plan)
+
+
+def test_sql_calibrate_matches_python_percentiles(store: SQLiteCalibrationStore) -> None:
+    rng = random.Random(7)
+    observations = [
+        _observation(
+            task_type=rng.choice(["feature", "bugfix", "docs"]),
+            error_ratio=rng.choice([rng.random() * 3, 0.5]),
+            observed_at=rng.choice(["2026-02-16T12:00:00+00:00", "2026-02-24T09:00:00+00:00"]),
+        )
+        for _ in range(60)
+    ]
+    store.insert_observations(observations)
+
+    store.calibrate()
+    sql_rows = store.query_calibration_summary()
+    store._calibrate_in_python()
+    python_rows = store.query_calibration_summary()
+
+    assert len(sql_rows) == len(python_rows) == 6
+    for sql_row, python_row in zip(sql_rows, python_rows):
+        assert sql_row["week_start"] == python_row["week_start"]
+        assert sql_row["task_type"] == python_row["task_type"]
+        assert sql_row["sample_count"] == python_row["sample_count"]
+        for column in ("median_error_pct", "p10", "p90"):
+            assert sql_row[column] == pytest.approx(python_row[column])
+
+
+def test_task_type_ids_are_cached_after_first_insert(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache.db"
+    with SQLiteCalibrationStore(db_path) as store:
+        store.insert_observation(_observation(task_type="feature"))
+
+    statements: list[str] = []
+    with SQLiteCalibrationStore(db_path) as store:
+        store._connection.set_trace_callback(statements.append)
+        store.insert_observation(_observation(task_type="feature"))
+        store.insert_observations([_observation(task_type="feature")])
+
+    assert not any("task_types" in statement for statement in statements)
+
+
+def test_task_type_cache_skips_rolled_back_ids(store: SQLiteCalibrationStore) -> None:
+    store._connection.execute(
+        """
+        CREATE TRIGGER reject_docs BEFORE INSERT ON observations
+        WHEN NEW.verdict = 'reject' BEGIN SELECT RAISE(ABORT, 'rejected'); END
+        """,
+    )
+    rejected = ObservationInput(**{**_observation(task_type="docs").__dict__, "verdict": "reject"})
+
+    with pytest.raises(sqlite3.IntegrityError):
+        store.insert_observations([rejected])
+
+    assert "docs" not in store._task_type_ids
+    [row_id] = store.insert_observations([_observation(task_type="docs")])
+    assert store._query_observations(task_type="docs")[0]["id"] == row_id
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_modifiers_encode_identically_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(sqlite_store, "orjson", None)
+
+    encoded = sqlite_store._encode_modifiers({"warm_context": 0.7, "spec_clarity": 0.75})
+
+    assert encoded == '{"spec_clarity":0.75,"warm_context":0.7}'
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_observation_input_rejects_non_finite_modifiers(value: float) -> None:
+    values = {**_observation().__dict__, "modifiers_should_have_been": {"spec_clarity": value}}
+
+    with pytest.raises(ValueError, match="modifiers_should_have_been values must be finite"):
+        ObservationInput(**values)
+
+
+@pytest.mark.parametrize(
+    ("observed_at", "expected_week_start"),
+    [
+        ("2026-02-16T12:00:00+00:00", "2026-02-16"),  # Monday
+        ("2026-02-22T23:59:59+00:00", "2026-02-16"),  # Sunday
+        ("2026-02-23T00:30:00+02:00", "2026-02-23"),  # local Monday, UTC Sunday
+        ("2026-03-01T08:00:00Z", "2026-02-23"),
+        ("2026-01-01", "2025-12-29"),
+    ],
+)
+def test_week_start_is_monday_of_local_calendar_week(
+    store: SQLiteCalibrationStore, observed_at: str, expected_week_start: str
+) -> None:
+    store.insert_observation(_observation(observed_at=observed_at))
+
+    assert store._query_observations()[0]["week_start"] == expected_week_start
+
+
+@pytest.mark.parametrize(
+    "observed_at",
+    ["2026-01-15garbage", "not-a-date", "", "20260105T101010", "20260105", "2026-W02-1"],
+)
+def test_observation_input_rejects_invalid_observed_at(observed_at: str) -> None:
+    with pytest.raises(ValueError, match="observed_at must be an ISO 8601 timestamp"):
+        _observation(observed_at=observed_at)
+
+
+def test_insert_observation_async_batches_writes_and_resolves_ids(tmp_path: Path) -> None:
+    db_path = tmp_path / "async.db"
+    store = SQLiteCalibrationStore(db_path)
+    try:
+        futures = [
+            store.insert_observation_async(_observation(error_ratio=ratio / 10))
+            for ratio in range(5)
+        ]
+        row_ids = [future.result(timeout=5) for future in futures]
+        rows = {row["id"]: row for row in store._query_observations()}
+    finally:
+        store.close()
+
+    assert row_ids == sorted(row_ids)
+    assert [rows[row_id]["error_ratio"] for row_id in row_ids] == pytest.approx(
+        [0.0, 0.1, 0.2, 0.3, 0.4],
+    )
+
+
+def test_close_flushes_queued_async_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "flush.db"
+    store = SQLiteCalibrationStore(db_path)
+    future = store.insert_observation_async(_observation())
+    store.close()
+
+    assert future.done()
+    with SQLiteCalibrationStore(db_path) as reopened:
+        assert [row["id"] for row in reopened._query_observations()] == [future.result()]
+
+
+def test_insert_observation_async_after_close_raises(tmp_path: Path) -> None:
+    store = SQLiteCalibrationStore(tmp_path / "closed.db")
+    store.close()
+
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        store.insert_observation_async(_observation())
+    assert store._writer is None
+
+
+def test_async_write_failure_is_reported_through_future(tmp_path: Path) -> None:
+    invalid = ObservationInput.trusted(**{**_observation().__dict__, "verdict": None})
+    with SQLiteCalibrationStore(tmp_path / "failed.db") as store:
+        future = store.insert_observation_async(invalid)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            future.result(timeout=5)
+
+
+def test_async_writer_survives_unexpected_batch_errors(tmp_path: Path) -> None:
+    invalid = ObservationInput.trusted(**{**_observation().__dict__, "task_type": None})
+    with SQLiteCalibrationStore(tmp_path / "unexpected.db") as store:
+        failed = store.insert_observation_async(invalid)
+
+        with pytest.raises(AttributeError):
+            failed.result(timeout=5)
+        assert store.insert_observation_async(_observation()).result(timeout=5) > 0
+
+
+def test_queries_use_read_only_connection(store: SQLiteCalibrationStore) -> None:
+    store.insert_observation(_observation())
+
+    assert store._read_connection is not store._connection
+    assert len(store._query_observations()) == 1
+    with pytest.raises(sqlite3.OperationalError):
+        store._read_connection.execute("DELETE FROM observations")
+
+
+def test_python_calibrate_inserts_summary_rows_in_chunks(store: SQLiteCalibrationStore) -> None:
+    group_count = sqlite_store._SUMMARY_ROWS_PER_INSERT * 2 + 1
+    store.insert_observations(
+        [_observation(task_type=f"type-{index:04d}") for index in range(group_count)],
+    )
+
+    store._calibrate_in_python()
+    python_rows = store.query_calibration_summary()
+    store.calibrate(full=True)
+
+    assert len(python_rows) == group_count
+    assert python_rows == store.query_calibration_summary()
+
+
+def test_python_calibrate_avoids_upsert_syntax(store: SQLiteCalibrationStore) -> None:
+    statements: list[str] = []
+    store._connection.set_trace_callback(statements.append)
+    for _ in range(2):
+        store.insert_observation(_observation())
+        store._calibrate_in_python()
+    store._connection.set_trace_callback(None)
+
+    assert not any("ON CONFLICT" in statement for statement in statements)
+    assert store._calibrated_observation_id() == store._latest_observation_id()
+
+
+def test_calibrate_only_recomputes_groups_with_new_observations(
+    store: SQLiteCalibrationStore,
+) -> None:
+    store.insert_observations(
+        [_observation(task_type="feature", error_ratio=0.1), _observation(task_type="docs")],
+    )
+    store.calibrate()
+    statements: list[str] = []
+    store._connection.set_trace_callback(statements.append)
+
+    store.calibrate()
+    assert not any("calibration_summary" in statement for statement in statements)
+
+    store.insert_observation(_observation(task_type="feature", error_ratio=0.3))
+    store._connection.execute("UPDATE calibration_summary SET p90 = -1 WHERE sample_count = 1")
+    store._connection.commit()
+    store.calibrate()
+
+    rows = {row["task_type"]: row for row in store.query_calibration_summary()}
+    assert rows["feature"]["sample_count"] == 2
+    assert rows["feature"]["median_error_pct"] == pytest.approx(20.0)
+    assert rows["docs"]["p90"] == -1  # untouched: no new observations for docs
+
+    store.calibrate(full=True)
+    assert store.query_calibration_summary()[0]["p90"] == pytest.approx(20.0)
+
+
+def test_query_observations_by_type_is_index_ordered_and_named(tmp_path: Path) -> None:
+    db_path = tmp_path / "names.db"
+    with SQLiteCalibrationStore(db_path) as writer, SQLiteCalibrationStore(db_path) as reader:
+        writer.insert_observation(_observation(task_type="docs"))
+        writer.insert_observation(_observation(task_type="feature"))
+
+        # The reader never inserted these task types, so its id cache is cold.
+        assert [row["task_type"] for row in reader._query_observations()] == ["docs", "feature"]
+
+        plan = reader._read_connection.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM observations
+            WHERE task_type_id = (SELECT id FROM task_types WHERE name = ?)
+            ORDER BY observed_at ASC
+            """,
+            ("docs",),
+        ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_obs_task_observed" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_iter_export_streams_batches_and_checks_opt_in_eagerly(
+    store: SQLiteCalibrationStore,
+) -> None:
+    with pytest.raises(PermissionError):
+        store.iter_export_calibration_summary()
+
+    store.insert_observations(
+        [_observation(task_type=f"type-{index}") for index in range(3) for _ in range(5)],
+    )
+    store.calibrate()
+
+    exported = store.iter_export_calibration_summary(allow_export=True, batch_size=2)
+    first = next(exported)
+    assert len(store.query_calibration_summary()) == 3  # read lock is free between batches
+
+    assert [first, *exported] == store.export_calibration_summary(allow_export=True)
+
+
+def test_observation_row_matches_insert_placeholders(store: SQLiteCalibrationStore) -> None:
+    row = sqlite_store._observation_row(_observation(), task_type_id=1)
+
+    assert len(row) == sqlite_store._INSERT_OBSERVATION_SQL.count("?")
+    store.insert_observation(_observation())
+    stored_row = store._query_observations()[0]
+    assert stored_row["review_overhead_secs"] == pytest.approx(30.0)
+    assert stored_row["verdict"] == "pass"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
 from agent_estimate.core.models import AgentProfile, TaskNode
@@ -177,6 +180,25 @@ class TestCriticalPath:
         assert plan.critical_path == ("A", "B", "D")
         assert plan.critical_path_minutes == pytest.approx(55.0)
 
+    def test_integer_task_ids(self) -> None:
+        tasks = [
+            TaskNode(task_id=0, duration_minutes=10),
+            TaskNode(task_id=1, duration_minutes=40, dependencies=(0,)),
+            TaskNode(task_id=2, duration_minutes=10, dependencies=(0,)),
+        ]
+        plan = plan_waves(tasks, [_agent(parallelism=2)])
+
+        assert plan.critical_path == (0, 1)
+        assert [a.task_id for a in plan.waves[0].assignments] == [0]
+
+    def test_integer_task_id_cycle_raises_value_error(self) -> None:
+        tasks = [
+            TaskNode(task_id=0, duration_minutes=10, dependencies=(1,)),
+            TaskNode(task_id=1, duration_minutes=10, dependencies=(0,)),
+        ]
+        with pytest.raises(ValueError, match=r"0 -> 1 -> 0|1 -> 0 -> 1"):
+            plan_waves(tasks, [_agent()])
+
 
 class TestUtilizationMetrics:
     """Check per-agent utilization and parallel efficiency values."""
@@ -511,3 +533,12 @@ class TestBatchReviewAcrossWaves:
         assert plan.waves[1].end_minutes == pytest.approx(80.0)
         assert plan.waves[0].agent_review_minutes["claude"] == pytest.approx(15.0)
         assert plan.waves[1].agent_review_minutes["claude"] == pytest.approx(15.0)
+
+
+def test_cli_import_does_not_load_networkx() -> None:
+    code = "import sys, agent_estimate.cli.app; print('networkx' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "False"
+